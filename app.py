@@ -1,20 +1,29 @@
 # app.py
 
 import tkinter as tk
-from tkinter import filedialog, messagebox, scrolledtext, ttk, Toplevel, Label
+from tkinter import filedialog, messagebox, scrolledtext, simpledialog, ttk, Toplevel, Label
 import os
 import threading
 import queue
 import sys
 from logger_setup import logger, LOG_FILEPATH
-from config_manager import ConfigManager
-from copier_logic import copy_worker
+from config_manager import ConfigManager, METADATA_POLICIES, ORDERING_STRATEGIES
+from copier_logic import copy_worker, plan_worker
+from copy_plan import CopyPlan, PLAN_FILE_EXTENSION, format_duration
+from job_queue import CopyJob, queue_worker, clamp_io_concurrency, IO_SLOTS_PER_JOB
+from copy_stats import ThroughputMonitor
 from constants import (
     APP_NAME, WINDOW_TITLE, BTN_ADD_FOLDER, BTN_REMOVE_SELECTED,
     BTN_BROWSE, BTN_START_COPY, BTN_CANCEL, BTN_OPEN_DEST_FOLDER,
     BTN_OPEN_LOG_FILE, BTN_CLEAR_LOG, LBL_SOURCE_FOLDERS,
     LBL_DESTINATION_FOLDER, LBL_SELECTED_SOURCES, LBL_DESTINATION,
-    LBL_PROCESS_LOG, LBL_PROGRESS, LBL_SCANNING,
+    LBL_PROCESS_LOG, LBL_PROGRESS, LBL_SCANNING, LBL_COPY_OPTIONS, LBL_THROUGHPUT,
+    CHK_ORGANIZE_BY_DATE, LBL_METADATA_POLICY, LBL_ORDERING, BTN_DRY_RUN, BTN_RUN_PLAN,
+    MSG_PLAN_READY_TITLE, MSG_RUN_PLAN_TITLE, MSG_PLAN_LOAD_ERROR, STATUS_PLANNED,
+    LBL_PROFILES_QUEUE, LBL_PROFILE, LBL_CONCURRENT_JOBS, LBL_IO_SLOTS,
+    BTN_LOAD_PROFILE, BTN_SAVE_PROFILE, BTN_DELETE_PROFILE, BTN_ADD_TO_QUEUE,
+    BTN_REMOVE_FROM_QUEUE, BTN_RUN_QUEUE, MSG_NO_PROFILE_SELECTED, MSG_QUEUE_EMPTY,
+    MSG_RUN_QUEUE_TITLE, MSG_QUEUE_FINISHED_TITLE,
     MSG_CONFIRM_COPY_TITLE, MSG_CONFIRM_CANCEL_TITLE, MSG_CONFIRM_EXIT_TITLE,
     MSG_FOLDER_ALREADY_ADDED, MSG_NO_SOURCE_FOLDERS, MSG_NO_DEST_FOLDER,
     MSG_DEST_FOLDER_NOT_EXIST, MSG_LOG_FILE_NOT_FOUND,
@@ -114,6 +123,14 @@ class ImageCopierApp:
         self.current_copy_thread = None
         self.message_queue = queue.Queue()
         self.cancel_event = threading.Event()
+        self.organize_by_date_var = tk.BooleanVar(value=False)
+        self.metadata_policy_var = tk.StringVar(value="full")
+        self.ordering_var = tk.StringVar(value="scan")
+        self.job_queue = [] # CopyJob objects shown in the queue list
+        self.running_jobs = [] # Jobs handed to the current queue_worker, indexed by message 'job'
+        self.concurrent_jobs_var = tk.IntVar(value=1)
+        self.io_slots_var = tk.IntVar(value=4)
+        self.throughput_monitor = ThroughputMonitor()
 
         self.config_manager = ConfigManager()
 
@@ -161,15 +178,93 @@ class ImageCopierApp:
         self.browse_dest_button.grid(row=0, column=2, padx=5)
         Tooltip(self.browse_dest_button, "Browse for and select the folder where images will be copied.")
 
+        # Copy Options
+        self.options_frame = tk.LabelFrame(self.controls_frame, text=LBL_COPY_OPTIONS, padx=5, pady=5)
+        self.options_frame.grid(row=2, column=0, columnspan=2, sticky="ew", pady=5)
+
+        self.organize_by_date_check = tk.Checkbutton(self.options_frame, text=CHK_ORGANIZE_BY_DATE, variable=self.organize_by_date_var)
+        self.organize_by_date_check.pack(side=tk.LEFT, padx=5)
+        Tooltip(self.organize_by_date_check, "Place copies in year/month/day sub-folders, using the EXIF capture date or the file's modification time.")
+
+        tk.Label(self.options_frame, text=LBL_METADATA_POLICY).pack(side=tk.LEFT, padx=(20, 5))
+        self.metadata_policy_combo = ttk.Combobox(self.options_frame, state="readonly", width=8,
+                                                  values=METADATA_POLICIES, textvariable=self.metadata_policy_var)
+        self.metadata_policy_combo.pack(side=tk.LEFT, padx=5)
+        Tooltip(self.metadata_policy_combo, "none: file data only (fastest). times: also keep modification times. "
+                                            "full: also permissions and extended attributes (slowest on network drives).")
+
+        tk.Label(self.options_frame, text=LBL_ORDERING).pack(side=tk.LEFT, padx=(20, 5))
+        self.ordering_combo = ttk.Combobox(self.options_frame, state="readonly", width=10,
+                                           values=ORDERING_STRATEGIES, textvariable=self.ordering_var)
+        self.ordering_combo.pack(side=tk.LEFT, padx=5)
+        Tooltip(self.ordering_combo, "scan: as found. directory: folder by folder. inode: approximate on-disk order "
+                                     "(fastest on spinning disks).")
+
+        # Profiles & Job Queue
+        self.queue_frame = tk.LabelFrame(self.controls_frame, text=LBL_PROFILES_QUEUE, padx=5, pady=5)
+        self.queue_frame.grid(row=3, column=0, columnspan=2, sticky="ew", pady=5)
+
+        profile_row = tk.Frame(self.queue_frame)
+        profile_row.pack(side=tk.TOP, fill=tk.X)
+        tk.Label(profile_row, text=LBL_PROFILE).pack(side=tk.LEFT, padx=5)
+        self.profile_combo = ttk.Combobox(profile_row, state="readonly", width=30)
+        self.profile_combo.pack(side=tk.LEFT, padx=5)
+
+        self.load_profile_button = tk.Button(profile_row, text=BTN_LOAD_PROFILE, command=self._load_selected_profile)
+        self.load_profile_button.pack(side=tk.LEFT, padx=5)
+        Tooltip(self.load_profile_button, "Replace the current sources, destination and options with the selected profile.")
+
+        self.save_profile_button = tk.Button(profile_row, text=BTN_SAVE_PROFILE, command=self._save_current_as_profile)
+        self.save_profile_button.pack(side=tk.LEFT, padx=5)
+        Tooltip(self.save_profile_button, "Save the current sources, destination and options as a named profile.")
+
+        self.delete_profile_button = tk.Button(profile_row, text=BTN_DELETE_PROFILE, command=self._delete_selected_profile)
+        self.delete_profile_button.pack(side=tk.LEFT, padx=5)
+        Tooltip(self.delete_profile_button, "Delete the selected profile.")
+
+        self.add_to_queue_button = tk.Button(profile_row, text=BTN_ADD_TO_QUEUE, command=self._add_profile_to_queue)
+        self.add_to_queue_button.pack(side=tk.LEFT, padx=5)
+        Tooltip(self.add_to_queue_button, "Append the selected profile to the job queue.")
+
+        self.queue_listbox = tk.Listbox(self.queue_frame, height=3, width=80, selectmode=tk.SINGLE)
+        self.queue_listbox.pack(side=tk.TOP, fill=tk.X, expand=True, pady=5)
+
+        queue_btn_row = tk.Frame(self.queue_frame)
+        queue_btn_row.pack(side=tk.TOP, fill=tk.X)
+        tk.Label(queue_btn_row, text=LBL_CONCURRENT_JOBS).pack(side=tk.LEFT, padx=5)
+        self.concurrent_jobs_spin = tk.Spinbox(queue_btn_row, from_=1, to=8, width=4, textvariable=self.concurrent_jobs_var)
+        self.concurrent_jobs_spin.pack(side=tk.LEFT, padx=5)
+        Tooltip(self.concurrent_jobs_spin, "How many queued jobs run at the same time. 1 runs them back to back.")
+        tk.Label(queue_btn_row, text=LBL_IO_SLOTS).pack(side=tk.LEFT, padx=5)
+        self.io_slots_spin = tk.Spinbox(queue_btn_row, from_=1, to=8 * IO_SLOTS_PER_JOB, width=4, textvariable=self.io_slots_var)
+        self.io_slots_spin.pack(side=tk.LEFT, padx=5)
+        Tooltip(self.io_slots_spin, f"Maximum number of file operations (listings, metadata reads, copies) in flight across all running jobs.\nEach running job can use up to {IO_SLOTS_PER_JOB}.")
+
+        self.remove_from_queue_button = tk.Button(queue_btn_row, text=BTN_REMOVE_FROM_QUEUE, command=self._remove_selected_job)
+        self.remove_from_queue_button.pack(side=tk.LEFT, padx=5)
+        Tooltip(self.remove_from_queue_button, "Remove the selected job from the queue.")
+
+        self.run_queue_button = tk.Button(queue_btn_row, text=BTN_RUN_QUEUE, command=self._run_job_queue)
+        self.run_queue_button.pack(side=tk.LEFT, padx=5)
+        Tooltip(self.run_queue_button, "Run every queued job that has not run yet.")
+
         # Action Buttons
         self.buttons_frame = tk.Frame(self.controls_frame, padx=5, pady=5)
-        self.buttons_frame.grid(row=2, column=0, columnspan=2, pady=5)
+        self.buttons_frame.grid(row=4, column=0, columnspan=2, pady=5)
 
         self.start_button = tk.Button(self.buttons_frame, text=BTN_START_COPY, command=self._start_copy_process,
                                       font=("Helvetica", 10, "bold"), bg="lightblue")
         self.start_button.pack(side=tk.LEFT, padx=10, pady=5)
         Tooltip(self.start_button, "Start the process of copying images from source(s) to destination.")
 
+        self.dry_run_button = tk.Button(self.buttons_frame, text=BTN_DRY_RUN, command=self._start_dry_run)
+        self.dry_run_button.pack(side=tk.LEFT, padx=10, pady=5)
+        Tooltip(self.dry_run_button, "Scan the source folders without copying and show what would be copied, with an estimated duration.")
+
+        self.run_plan_button = tk.Button(self.buttons_frame, text=BTN_RUN_PLAN, command=self._run_saved_plan)
+        self.run_plan_button.pack(side=tk.LEFT, padx=10, pady=5)
+        Tooltip(self.run_plan_button, "Execute a previously saved copy plan without rescanning the source folders.")
+
         self.cancel_button = tk.Button(self.buttons_frame, text=BTN_CANCEL, command=self._cancel_copy_process,
                                        font=("Helvetica", 10), bg="lightcoral", state=tk.DISABLED)
         self.cancel_button.pack(side=tk.LEFT, padx=10, pady=5)
@@ -189,12 +284,22 @@ class ImageCopierApp:
 
         # Progress Bar
         self.progress_frame = tk.Frame(self.controls_frame, padx=5, pady=5)
-        self.progress_frame.grid(row=3, column=0, columnspan=2, sticky="ew")
+        self.progress_frame.grid(row=5, column=0, columnspan=2, sticky="ew")
         self.progress_label = tk.Label(self.progress_frame, text=LBL_PROGRESS)
         self.progress_label.pack(side=tk.TOP, anchor=tk.W)
         self.progress_bar = ttk.Progressbar(self.progress_frame, orient="horizontal", length=500, mode="determinate")
         self.progress_bar.pack(side=tk.TOP, fill=tk.X, expand=True)
 
+        # Throughput panel, refreshed from the workers' sampled 'stats' snapshots
+        self.stats_frame = tk.LabelFrame(self.controls_frame, text=LBL_THROUGHPUT, padx=5, pady=5)
+        self.stats_frame.grid(row=6, column=0, columnspan=2, sticky="ew", pady=5)
+        self.stats_labels = {}
+        for index, key in enumerate(('instant', 'average', 'workers', 'queue', 'errors', 'eta')):
+            label = tk.Label(self.stats_frame, anchor=tk.W, width=40)
+            label.grid(row=index // 3, column=index % 3, sticky="w", padx=5)
+            self.stats_labels[key] = label
+        self._reset_stats_panel()
+
         # Log Output
         self.log_frame = tk.LabelFrame(self.master, text=LBL_PROCESS_LOG, padx=10, pady=5)
         self.log_frame.pack(side=tk.BOTTOM, fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -213,6 +318,12 @@ class ImageCopierApp:
         if self.config_manager.load_settings():
             self.source_folders = self.config_manager.source_folders
             self.destination_folder = self.config_manager.destination_folder
+            self.organize_by_date_var.set(self.config_manager.copy_options["organize_by_date"])
+            self.metadata_policy_var.set(self.config_manager.copy_options["metadata_policy"])
+            self.ordering_var.set(self.config_manager.copy_options["ordering"])
+            self.concurrent_jobs_var.set(self.config_manager.job_queue_settings["max_concurrent_jobs"])
+            self.io_slots_var.set(self.config_manager.job_queue_settings["io_concurrency"])
+            self._update_profile_combo()
             self._update_source_listbox()
             
             self.dest_entry.config(state="normal")
@@ -303,7 +414,14 @@ class ImageCopierApp:
             message_data = self.message_queue.get()
             msg_type = message_data.get('type')
 
-            if msg_type == 'progress':
+            if 'job' in message_data:
+                self._handle_job_message(message_data)
+            elif msg_type == 'queue_finished':
+                self._on_queue_finished(message_data)
+                return
+            elif msg_type == 'stats':
+                self._update_stats_panel(message_data)
+            elif msg_type == 'progress':
                 current = message_data.get('current', 0)
                 total = message_data.get('total', 0)
                 mode = message_data.get('mode', 'determinate')
@@ -327,6 +445,9 @@ class ImageCopierApp:
                 self.progress_bar.stop()
                 self.progress_bar['mode'] = 'determinate'
                 status = message_data.get('status')
+                if status == 'planned':
+                    self._on_plan_ready(message_data.get('plan'))
+                    return
                 copied_count = message_data.get('copied_count', 0)
                 skipped_count = message_data.get('skipped_count', 0)
                 self._on_copy_finished(status, copied_count, skipped_count)
@@ -355,7 +476,7 @@ class ImageCopierApp:
             return # Prevent starting the copy process
         confirm = messagebox.askyesno(
             MSG_CONFIRM_COPY_TITLE,
-            f"Are you sure you want to copy images from {len(self.source_folders)} folder(s) to:\n'{self.destination_folder}'?\n\nExisting files will be renamed to unique IDs."
+            f"Are you sure you want to copy images from {len(self.source_folders)} folder(s) to:\n'{self.destination_folder}'?\n\nCopied files will be renamed to 'YYYYMMDD_HHMMSS_UniqueId' names."
         )
         if not confirm:
             logger.info("Copy process cancelled by user confirmation dialog.")
@@ -366,18 +487,317 @@ class ImageCopierApp:
         self._display_message_in_ui({'level': 'info', 'message': "Initiating copy process..."})
         self._update_status_bar("Starting copy process...") # <--- NEW: Update status
 
+        self._launch_worker(copy_worker, (self.source_folders, self.destination_folder, self.message_queue,
+                                          self.cancel_event, self._get_copy_options()))
+
+    def _launch_worker(self, target, args):
+        """Runs a worker function on a background thread and starts polling its messages."""
         self.cancel_event.clear()
         self._set_ui_state_on_start()
+        self._reset_stats_panel()
         
-        self.current_copy_thread = threading.Thread(
-            target=copy_worker,
-            args=(self.source_folders, self.destination_folder, self.message_queue, self.cancel_event)
-        )
+        self.current_copy_thread = threading.Thread(target=target, args=args)
         self.current_copy_thread.daemon = True
         self.current_copy_thread.start()
 
         self.master.after(100, self._check_message_queue)
 
+    def _start_dry_run(self):
+        if not self.source_folders:
+            messagebox.showwarning("Warning", MSG_NO_SOURCE_FOLDERS)
+            logger.warning("Attempted to start dry run without source folders.")
+            return
+        if not self.destination_folder:
+            messagebox.showwarning("Warning", MSG_NO_DEST_FOLDER)
+            logger.warning("Attempted to start dry run without destination folder.")
+            return
+        if not os.path.isdir(self.destination_folder):
+            messagebox.showerror("Error", f"The selected destination folder does not exist or is not a valid directory:\n'{self.destination_folder}'\nPlease select a valid folder.")
+            logger.error(f"Invalid destination folder selected: {self.destination_folder}")
+            return
+
+        self._clear_log_display()
+        self._update_status_bar("Starting dry run...")
+        self._launch_worker(plan_worker, (self.source_folders, self.destination_folder, self.message_queue,
+                                          self.cancel_event, self._get_copy_options()))
+
+    def _on_plan_ready(self, plan):
+        """Called when a dry run finishes; offers to save the plan for later execution."""
+        self.progress_bar.stop()
+        self.progress_bar['mode'] = 'determinate'
+        self._set_ui_state_on_finish()
+        self._update_status_bar(STATUS_PLANNED)
+        summary = "\n".join(plan.summary_lines())
+        if messagebox.askyesno(MSG_PLAN_READY_TITLE, f"{summary}\n\nSave this plan to run it later?"):
+            plan_path = filedialog.asksaveasfilename(
+                title="Save Copy Plan", defaultextension=PLAN_FILE_EXTENSION,
+                filetypes=[("Copy plans", f"*{PLAN_FILE_EXTENSION}"), ("All files", "*.*")])
+            if plan_path:
+                try:
+                    plan.save(plan_path)
+                    self._update_status_bar(f"Plan saved: {os.path.basename(plan_path)}")
+                except OSError as e:
+                    messagebox.showerror("Error", f"Could not save plan: {e}")
+                    logger.error(f"Failed to save plan to '{plan_path}': {e}")
+        plan.file_list.close()
+
+    def _run_saved_plan(self):
+        plan_path = filedialog.askopenfilename(
+            title="Select Copy Plan", filetypes=[("Copy plans", f"*{PLAN_FILE_EXTENSION}"), ("All files", "*.*")])
+        if not plan_path:
+            return
+        try:
+            plan = CopyPlan.load(plan_path, self._get_copy_options()["max_files_in_memory"])
+        except (OSError, ValueError, KeyError, IndexError, TypeError) as e:
+            messagebox.showerror(MSG_PLAN_LOAD_ERROR, f"Could not load plan '{plan_path}':\n{e}")
+            logger.error(f"Failed to load plan '{plan_path}': {e}")
+            return
+
+        if not plan.destination_folder or not os.path.isdir(plan.destination_folder):
+            # The plan's destination is missing or no longer exists: let the user pick one
+            logger.warning(f"Plan destination '{plan.destination_folder}' is not available; asking for a new one.")
+            folder_selected = filedialog.askdirectory(title="Select Destination Folder for Plan")
+            if not folder_selected:
+                plan.file_list.close()
+                messagebox.showwarning("Warning", MSG_NO_DEST_FOLDER)
+                return
+            plan.destination_folder = os.path.normpath(folder_selected)
+
+        summary = "\n".join(plan.summary_lines())
+        if not messagebox.askyesno(MSG_RUN_PLAN_TITLE, f"{summary}\n\nCopy these files now?"):
+            plan.file_list.close()
+            return
+
+        self._clear_log_display()
+        self._display_message_in_ui({'level': 'info', 'message': f"Running saved plan: {plan_path}"})
+        self._update_status_bar("Starting saved plan...")
+        self._launch_worker(copy_worker, (plan.source_folders, plan.destination_folder, self.message_queue,
+                                          self.cancel_event, plan.options, plan))
+
+    def _update_profile_combo(self):
+        """Refreshes the profile selector from ConfigManager."""
+        names = sorted(self.config_manager.profiles)
+        self.profile_combo['values'] = names
+        if self.profile_combo.get() not in names:
+            self.profile_combo.set(names[0] if names else "")
+
+    def _get_selected_profile(self):
+        name = self.profile_combo.get()
+        if not name or name not in self.config_manager.profiles:
+            messagebox.showwarning("Warning", MSG_NO_PROFILE_SELECTED)
+            return None, None
+        return name, self.config_manager.profiles[name]
+
+    def _save_current_as_profile(self):
+        if not self.source_folders:
+            messagebox.showwarning("Warning", MSG_NO_SOURCE_FOLDERS)
+            return
+        if not self.destination_folder:
+            messagebox.showwarning("Warning", MSG_NO_DEST_FOLDER)
+            return
+        name = simpledialog.askstring("Save Profile", "Profile name:", initialvalue=self.profile_combo.get(), parent=self.master)
+        if not name or not name.strip():
+            return
+        name = name.strip()
+        if name in self.config_manager.profiles and not messagebox.askyesno("Overwrite Profile", f"Replace the existing profile '{name}'?"):
+            return
+        self.config_manager.save_profile(name, self.source_folders, self.destination_folder, self._get_copy_options())
+        self._save_settings()
+        self._update_profile_combo()
+        self.profile_combo.set(name)
+        self._update_status_bar(f"Profile saved: {name}")
+
+    def _load_selected_profile(self):
+        name, profile = self._get_selected_profile()
+        if profile is None:
+            return
+        self.source_folders = list(profile["source_folders"])
+        self.destination_folder = profile["destination_folder"]
+        self.organize_by_date_var.set(profile["copy_options"]["organize_by_date"])
+        self.metadata_policy_var.set(profile["copy_options"]["metadata_policy"])
+        self.ordering_var.set(profile["copy_options"]["ordering"])
+        self._update_source_listbox()
+        self.dest_entry.config(state="normal")
+        self.dest_entry.delete(0, tk.END)
+        self.dest_entry.insert(0, self.destination_folder)
+        self.dest_entry.config(state="readonly")
+        self._update_destination_entry_visual()
+        self._set_initial_states()
+        self._update_status_bar(f"Profile loaded: {name}")
+
+    def _delete_selected_profile(self):
+        name, profile = self._get_selected_profile()
+        if profile is None:
+            return
+        if not messagebox.askyesno("Delete Profile", f"Delete the profile '{name}'?"):
+            return
+        self.config_manager.delete_profile(name)
+        self._save_settings()
+        self._update_profile_combo()
+        self._update_status_bar(f"Profile deleted: {name}")
+
+    def _add_profile_to_queue(self):
+        name, profile = self._get_selected_profile()
+        if profile is None:
+            return
+        self.job_queue.append(CopyJob.from_profile(name, profile))
+        self._update_queue_listbox()
+        self._update_status_bar(f"Queued: {name}")
+
+    def _remove_selected_job(self):
+        selected_index = self.queue_listbox.curselection()
+        if not selected_index:
+            messagebox.showwarning("Warning", "Please select a job to remove.")
+            return
+        removed_job = self.job_queue.pop(selected_index[0])
+        self._update_queue_listbox()
+        self._update_status_bar(f"Removed from queue: {removed_job.name}")
+
+    def _update_queue_listbox(self):
+        """Refreshes the job queue listbox."""
+        self.queue_listbox.delete(0, tk.END)
+        for job in self.job_queue:
+            self.queue_listbox.insert(tk.END, job.describe())
+
+    def _refresh_queue_entry(self, job):
+        if job in self.job_queue:
+            index = self.job_queue.index(job)
+            self.queue_listbox.delete(index)
+            self.queue_listbox.insert(index, job.describe())
+
+    def _get_job_queue_settings(self):
+        """Reads the queue limits from the spinboxes, falling back to the saved values."""
+        settings = dict(self.config_manager.job_queue_settings)
+        try:
+            settings["max_concurrent_jobs"] = max(1, int(self.concurrent_jobs_var.get()))
+            settings["io_concurrency"] = max(1, int(self.io_slots_var.get()))
+        except (tk.TclError, ValueError):
+            logger.warning("Invalid job queue limits entered; using the saved values.")
+        io_concurrency = clamp_io_concurrency(settings["max_concurrent_jobs"], settings["io_concurrency"])
+        if io_concurrency != settings["io_concurrency"]:
+            logger.warning(f"I/O slots reduced to {io_concurrency}: {settings['max_concurrent_jobs']} concurrent job(s) "
+                           f"cannot use more.")
+            settings["io_concurrency"] = io_concurrency
+            self.io_slots_var.set(io_concurrency)
+        return settings
+
+    def _run_job_queue(self):
+        pending_jobs = [job for job in self.job_queue if job.status == 'queued']
+        if not pending_jobs:
+            messagebox.showwarning("Warning", MSG_QUEUE_EMPTY)
+            return
+        queue_settings = self._get_job_queue_settings()
+        if not messagebox.askyesno(
+            MSG_RUN_QUEUE_TITLE,
+            f"Run {len(pending_jobs)} queued job(s), {queue_settings['max_concurrent_jobs']} at a time, "
+            f"with {queue_settings['io_concurrency']} I/O slot(s)?"
+        ):
+            return
+
+        self.config_manager.job_queue_settings = queue_settings
+        self.running_jobs = pending_jobs
+        self._clear_log_display()
+        self._display_message_in_ui({'level': 'info', 'message': f"Starting job queue with {len(pending_jobs)} job(s)..."})
+        self._update_status_bar("Running job queue...")
+        self._launch_worker(queue_worker, (pending_jobs, self.message_queue, self.cancel_event,
+                                           queue_settings["max_concurrent_jobs"], queue_settings["io_concurrency"]))
+
+    def _handle_job_message(self, message_data):
+        """Routes a message tagged by queue_worker to the queue list, progress bar or log."""
+        job = self.running_jobs[message_data['job']]
+        msg_type = message_data.get('type')
+        if msg_type == 'progress':
+            if message_data.get('mode', 'determinate') == 'determinate':
+                job.current = message_data.get('current', 0)
+                job.total = message_data.get('total', 0)
+            self._refresh_queue_entry(job)
+            self._update_queue_progress()
+        elif msg_type == 'stats':
+            self._update_stats_panel(message_data, message_data['job'])
+        elif msg_type in ('job_status', 'finished'):
+            if msg_type == 'finished':
+                self._display_message_in_ui({'level': 'info', 'message': f"[{job.name}] Job finished: {message_data.get('status')}"})
+            self._refresh_queue_entry(job)
+            self._update_queue_progress()
+        else:
+            self._display_message_in_ui({**message_data, 'message': f"[{job.name}] {message_data.get('message', '')}"})
+
+    def _update_queue_progress(self):
+        """Shows the combined file progress of all jobs in the running queue."""
+        current = sum(job.current for job in self.running_jobs)
+        total = sum(job.total for job in self.running_jobs)
+        done = sum(1 for job in self.running_jobs if job.status not in ('queued', 'running'))
+        self.progress_bar.stop()
+        self.progress_bar['mode'] = 'determinate'
+        self.progress_bar['maximum'] = max(total, 1)
+        self.progress_bar['value'] = current
+        self.progress_label.config(text=f"Queue: {current}/{total} files, {done}/{len(self.running_jobs)} jobs done")
+
+    def _on_queue_finished(self, message_data):
+        """Called when queue_worker has run every job."""
+        self.progress_bar.stop()
+        self.progress_bar['mode'] = 'determinate'
+        self._set_ui_state_on_finish(cancelled=message_data.get('status') == 'cancelled')
+        self._update_queue_listbox()
+        results = "\n".join(
+            f"{result['name']}: {result['status']} (copied {result['copied_count']}, skipped {result['skipped_count']})"
+            for result in message_data.get('results', [])
+        )
+        status = message_data.get('status')
+        logger.info(f"Job queue finished ({status}).\n{results}")
+        if status == 'completed':
+            messagebox.showinfo(MSG_QUEUE_FINISHED_TITLE, results)
+            self._update_status_bar(STATUS_COMPLETE)
+        elif status == 'cancelled':
+            messagebox.showinfo(MSG_QUEUE_FINISHED_TITLE, f"The job queue was cancelled.\n\n{results}")
+            self._update_status_bar(STATUS_CANCELLED)
+        else:
+            messagebox.showwarning(MSG_QUEUE_FINISHED_TITLE, f"{results}\n\nCheck log for details.")
+            self._update_status_bar(STATUS_COMPLETE_ERRORS)
+
+    def _reset_stats_panel(self):
+        self.throughput_monitor.reset()
+        for key, label in self.stats_labels.items():
+            label.config(text=self._format_stat(key, None))
+
+    def _update_stats_panel(self, snapshot, source=None):
+        """Feeds one sampled worker snapshot to the monitor and refreshes the panel."""
+        self.throughput_monitor.update(snapshot, source)
+        summary = self.throughput_monitor.summary()
+        # Jobs that have not started yet have no snapshot, so the figures cover the running jobs only
+        summary['queued_jobs'] = sum(1 for job in self.running_jobs if job.status == 'queued') if source is not None else 0
+        for key, label in self.stats_labels.items():
+            label.config(text=self._format_stat(key, summary))
+
+    @staticmethod
+    def _format_stat(key, summary):
+        if summary is None:
+            return {'instant': "Now: -", 'average': "Average: -", 'workers': "Workers: -",
+                    'queue': "Queue depth: -", 'errors': "Errors: -", 'eta': "ETA: -"}[key]
+        if key == 'instant':
+            return f"Now: {summary['instant_mbps']:.2f} MB/s, {summary['instant_fps']:.1f} files/s"
+        if key == 'average':
+            return f"Average: {summary['average_mbps']:.2f} MB/s, {summary['average_fps']:.1f} files/s"
+        if key == 'workers':
+            text = f"Workers: {summary['active_workers']} busy"
+            if summary['copying_workers']:
+                text += f" ({summary['copying_workers']} copy, {summary['metadata_workers']} metadata"
+                text += f", {summary['scanning_workers']} scan)" if summary['scanning_workers'] else ")"
+            elif summary['scanning_workers']:
+                text += f" ({summary['scanning_workers']} scan)"
+            return text
+        if key == 'queue':
+            if summary['scanning_workers']:
+                return f"Queue depth: {summary['remaining_files']} files, {summary['files_scanned']} scanned"
+            return f"Queue depth: {summary['remaining_files']} files ({summary['metadata_pending']} read ahead)"
+        if key == 'errors':
+            return f"Errors: {summary['errors']} ({summary['error_rate']:.1%})"
+        eta = summary['eta_seconds']
+        eta_text = format_duration(eta) if eta is not None else '-'
+        if summary.get('queued_jobs'):
+            return f"ETA of running jobs: {eta_text} (+{summary['queued_jobs']} queued)"
+        return f"ETA: {eta_text}"
+
     def _cancel_copy_process(self):
         if messagebox.askyesno(MSG_CONFIRM_CANCEL_TITLE, "Are you sure you want to cancel the current copying process?"):
             self.cancel_event.set()
@@ -388,15 +808,17 @@ class ImageCopierApp:
             self.progress_bar['mode'] = 'determinate'
             self.progress_bar['value'] = 0
             self.progress_label.config(text=LBL_PROGRESS) 
-            self._update_status_bar(STATUS_CANCELLED) # <--- NEW: Update status
+            self._update_status_bar("Cancelling...")
 
-            self._set_ui_state_on_finish(cancelled=True)
+            # The controls stay disabled until the worker's 'finished' (or 'queue_finished')
+            # message arrives, so a new run cannot start while the old one is still draining
+            self.cancel_button.config(state=tk.DISABLED)
 
     def _on_copy_finished(self, status, copied_count, skipped_count):
         """Called when the worker thread signals completion."""
         self.progress_bar.stop()
         self.progress_bar['mode'] = 'determinate'
-        self._set_ui_state_on_finish()
+        self._set_ui_state_on_finish(cancelled=status == 'cancelled')
         if status == 'completed':
             messagebox.showinfo(MSG_PROCESS_COMPLETE, f"Successfully copied {copied_count} image files.")
             logger.info(f"Copy process completed successfully. Copied: {copied_count}, Skipped: {skipped_count}")
@@ -417,19 +839,31 @@ class ImageCopierApp:
     def _set_ui_state_on_start(self):
         """Sets UI elements to a state appropriate for process start."""
         self.start_button.config(state=tk.DISABLED)
+        self.dry_run_button.config(state=tk.DISABLED)
+        self.run_plan_button.config(state=tk.DISABLED)
+        self._set_queue_controls_state(tk.DISABLED)
         self.cancel_button.config(state=tk.NORMAL)
         self.add_source_button.config(state=tk.DISABLED)
         self.remove_source_button.config(state=tk.DISABLED)
         self.browse_dest_button.config(state=tk.DISABLED)
+        self.organize_by_date_check.config(state=tk.DISABLED)
+        self.metadata_policy_combo.config(state=tk.DISABLED)
+        self.ordering_combo.config(state=tk.DISABLED)
         self.open_dest_button.config(state=tk.DISABLED)
 
     def _set_ui_state_on_finish(self, cancelled=False):
         """Sets UI elements back to a state appropriate for process finish."""
         self.start_button.config(state=tk.NORMAL)
+        self.dry_run_button.config(state=tk.NORMAL)
+        self.run_plan_button.config(state=tk.NORMAL)
+        self._set_queue_controls_state(tk.NORMAL)
         self.cancel_button.config(state=tk.DISABLED)
         self.add_source_button.config(state=tk.NORMAL)
         self.remove_source_button.config(state=tk.NORMAL)
         self.browse_dest_button.config(state=tk.NORMAL)
+        self.organize_by_date_check.config(state=tk.NORMAL)
+        self.metadata_policy_combo.config(state="readonly")
+        self.ordering_combo.config(state="readonly")
         self.progress_bar['value'] = 0
         self.progress_label.config(text=LBL_PROGRESS)
 
@@ -438,6 +872,13 @@ class ImageCopierApp:
         else:
             self.open_dest_button.config(state=tk.DISABLED)            
             
+    def _set_queue_controls_state(self, state):
+        for widget in (self.load_profile_button, self.save_profile_button, self.delete_profile_button,
+                       self.add_to_queue_button, self.remove_from_queue_button, self.run_queue_button,
+                       self.concurrent_jobs_spin, self.io_slots_spin):
+            widget.config(state=state)
+        self.profile_combo.config(state="readonly" if state == tk.NORMAL else tk.DISABLED)
+
     def _remove_selected_source_folder(self, event=None):
         selected_index = self.source_listbox.curselection()
         if selected_index:
@@ -531,14 +972,28 @@ class ImageCopierApp:
                     self._update_status_bar("Copy thread stopped. Exiting.")
                 # --- END MODIFIED ---
 
-                self.config_manager.save_settings(self.source_folders, self.destination_folder)
+                self._save_settings()
                 self.master.destroy()
             else:
                 pass
         else:
-            self.config_manager.save_settings(self.source_folders, self.destination_folder)
+            self._save_settings()
             self.master.destroy()
 
+    def _save_settings(self):
+        """Persists folders, copy options, profiles and queue limits."""
+        self.config_manager.job_queue_settings = self._get_job_queue_settings()
+        return self.config_manager.save_settings(self.source_folders, self.destination_folder, self._get_copy_options())
+
+    def _get_copy_options(self):
+        """Collects the copy engine options currently selected in the UI."""
+        return {
+            **self.config_manager.copy_options,
+            "organize_by_date": self.organize_by_date_var.get(),
+            "metadata_policy": self.metadata_policy_var.get(),
+            "ordering": self.ordering_var.get(),
+        }
+
     def _show_about_dialog(self):
         """Displays an About dialog with application information."""
         messagebox.showinfo("About " + APP_NAME, ABOUT_TEXT)
@@ -0,0 +1,121 @@
+# benchmark.py
+"""
+Command-line benchmark of the copy engine settings on real storage.
+
+Copies the images of a source folder into a fresh temporary folder once per
+combination of metadata policy and copy order, and prints throughput and
+per-file metadata cost, e.g.:
+
+    python benchmark.py D:\\Photos --dest-parent \\\\nas\\scratch --policies full --orderings scan inode directory
+
+By default (--cache cold) the source files are evicted from the OS page
+cache before every timed run, so each copy order reads from the storage
+itself; this uses posix_fadvise and is only available on Linux and other
+POSIX systems that have it. Elsewhere, compare copy orders with one
+ordering per process and flush the cache in between (remount the disk or
+reboot). --cache warm instead runs an untimed warm-up copy and measures
+every setting from cache, which isolates the metadata policy cost.
+Benchmark runs are not added to the throughput history used for plan estimates.
+"""
+import argparse
+import itertools
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from config_manager import DEFAULT_COPY_OPTIONS, IMAGE_EXTENSIONS, METADATA_POLICIES, ORDERING_STRATEGIES
+from copier_logic import copy_worker
+from logger_setup import logger
+
+CAN_EVICT_CACHE = hasattr(os, "posix_fadvise")
+
+class _ResultSink:
+    """Queue stand-in that keeps only the worker's 'finished' message."""
+    def __init__(self):
+        self.result = None
+
+    def put(self, message):
+        if message.get('type') == 'finished':
+            self.result = message
+
+def evict_from_cache(source_folder):
+    """Asks the OS to drop the cached pages of every image under source_folder. Returns the file count."""
+    evicted = 0
+    for dir_path, _, file_names in os.walk(source_folder):
+        for file_name in file_names:
+            if not file_name.lower().endswith(IMAGE_EXTENSIONS):
+                continue
+            try:
+                fd = os.open(os.path.join(dir_path, file_name), os.O_RDONLY)
+                try:
+                    os.fdatasync(fd) # Only clean pages can be dropped, e.g. for a freshly copied sample
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+                finally:
+                    os.close(fd)
+                evicted += 1
+            except OSError:
+                pass
+    return evicted
+
+def run_once(source_folder, dest_parent, options, cold=False):
+    """
+    Runs one copy into a temporary folder under dest_parent and returns the 'finished' message.
+    With `cold`, the source files are evicted from the page cache first.
+    """
+    if cold:
+        evict_from_cache(source_folder)
+    destination = tempfile.mkdtemp(prefix="image_copier_bench_", dir=dest_parent)
+    sink = _ResultSink()
+    # The worker logs a line per file; keep that I/O out of the measurement and the output
+    previous_level = logger.level
+    logger.setLevel(logging.WARNING)
+    try:
+        copy_worker([source_folder], destination, sink, threading.Event(), options, record_history=False)
+    finally:
+        logger.setLevel(previous_level)
+        shutil.rmtree(destination, ignore_errors=True)
+    return sink.result or {}
+
+def _format_row(label, result):
+    files = result.get('copied_count', 0)
+    elapsed = result.get('elapsed_seconds', 0) or float('nan')
+    megabytes = result.get('copied_bytes', 0) / (1024 * 1024)
+    metadata_ms = result.get('metadata_seconds', 0) * 1000 / files if files else 0.0
+    return (f"{label:<28} {files:>8} {megabytes:>10.1f} {elapsed:>9.2f} "
+            f"{files / elapsed:>9.1f} {megabytes / elapsed:>8.2f} {metadata_ms:>12.3f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark copy engine settings on a sample folder.")
+    parser.add_argument("source", help="Folder with sample images to copy.")
+    parser.add_argument("--dest-parent", default=None,
+                        help="Where temporary destination folders are created (the storage to measure).")
+    parser.add_argument("--policies", nargs="+", choices=METADATA_POLICIES, default=list(METADATA_POLICIES),
+                        help="Metadata policies to compare.")
+    parser.add_argument("--orderings", nargs="+", choices=ORDERING_STRATEGIES, default=["scan"],
+                        help="Copy orders to compare.")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per setting; the fastest run is reported.")
+    parser.add_argument("--cache", choices=("cold", "warm"), default="cold",
+                        help="cold: evict the source from the OS cache before each run (needed to compare "
+                             "copy orders); warm: warm up once and measure from cache.")
+    args = parser.parse_args()
+
+    cold = args.cache == "cold"
+    if cold and not CAN_EVICT_CACHE:
+        cold = False
+        print("This platform cannot evict files from the OS cache: only the first run reads from the storage.\n"
+              "To compare copy orders, run one --orderings value per process with --repeat 1 and flush the\n"
+              "cache in between (remount the source disk or reboot).")
+    elif args.cache == "warm":
+        print("Warming up (untimed)...")
+        run_once(args.source, args.dest_parent, DEFAULT_COPY_OPTIONS)
+
+    print(f"{'setting':<28} {'files':>8} {'MB':>10} {'seconds':>9} {'files/s':>9} {'MB/s':>8} {'meta ms/file':>12}")
+    for policy, ordering in itertools.product(args.policies, args.orderings):
+        options = {**DEFAULT_COPY_OPTIONS, "metadata_policy": policy, "ordering": ordering}
+        runs = [run_once(args.source, args.dest_parent, options, cold) for _ in range(max(1, args.repeat))]
+        best = min(runs, key=lambda result: result.get('elapsed_seconds', float('inf')))
+        print(_format_row(f"policy={policy} order={ordering}", best))
+
+if __name__ == "__main__":
+    main()
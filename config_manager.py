@@ -2,16 +2,73 @@
 import json
 import os
 from logger_setup import logger # Import the configured logger
+from file_list import DEFAULT_MAX_FILES_IN_MEMORY
 
 # Global application constants/configurations
 IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.webp', '.ico')
 SETTINGS_FILE = "settings.json"
+THROUGHPUT_HISTORY_FILE = "throughput_history.json" # Measured copy rates of previous runs, used for plan estimates
+# 'none': data only, 'times': + access/modification times, 'full': + permission bits, flags and xattrs
+METADATA_POLICIES = ('none', 'times', 'full')
+# 'scan': as enumerated, 'directory': grouped by folder path, 'inode': by device, then
+# inode number (approximates on-disk order)
+ORDERING_STRATEGIES = ('scan', 'directory', 'inode')
+
+# Copy engine options persisted alongside the folder selection
+DEFAULT_COPY_OPTIONS = {
+    "organize_by_date": False, # Place copies under YYYY/MM/DD sub-folders of the destination
+    "max_files_in_memory": DEFAULT_MAX_FILES_IN_MEMORY, # Work-list entries kept in RAM before spilling to disk (0 = never spill)
+    "metadata_policy": "full", # One of METADATA_POLICIES
+    "ordering": "scan", # One of ORDERING_STRATEGIES
+}
+
+# Allowed values of the string copy options; anything else falls back to the default
+COPY_OPTION_CHOICES = {
+    "metadata_policy": METADATA_POLICIES,
+    "ordering": ORDERING_STRATEGIES,
+}
+
+# Limits applied when several profiles are run from the job queue
+DEFAULT_JOB_QUEUE_SETTINGS = {
+    "max_concurrent_jobs": 1, # 1 = run queued jobs back to back
+    "io_concurrency": 4, # File operations (listings, metadata reads, copies) in flight across all running jobs
+}
+
+# Smallest accepted value of integer settings; any other integer setting must be at least 1
+INTEGER_SETTING_MINIMUMS = {
+    "max_files_in_memory": 0, # 0 = never spill
+}
+
+def _merge_with_defaults(loaded, defaults, choices=None):
+    """
+    Returns defaults overridden by the loaded values that have the expected type
+    (and, for keys in `choices`, one of the allowed values; for integers, at
+    least their INTEGER_SETTING_MINIMUMS entry, else 1).
+    """
+    merged = dict(defaults)
+    choices = choices or {}
+    if isinstance(loaded, dict):
+        for key, default in defaults.items():
+            value = loaded.get(key, default)
+            if not isinstance(value, type(default)) or isinstance(value, bool) != isinstance(default, bool):
+                continue
+            if key in choices and value not in choices[key]:
+                logger.warning(f"Ignoring unsupported value '{value}' for setting '{key}'; using '{default}'.")
+                continue
+            if isinstance(default, int) and not isinstance(default, bool) and value < INTEGER_SETTING_MINIMUMS.get(key, 1):
+                logger.warning(f"Ignoring out-of-range value {value} for setting '{key}'; using {default}.")
+                continue
+            merged[key] = value
+    return merged
 
 class ConfigManager:
     """Manages loading and saving application settings."""
     def __init__(self):
         self.source_folders = []
         self.destination_folder = ""
+        self.copy_options = dict(DEFAULT_COPY_OPTIONS)
+        self.profiles = {} # name -> {'source_folders', 'destination_folder', 'copy_options'}
+        self.job_queue_settings = dict(DEFAULT_JOB_QUEUE_SETTINGS)
 
     def load_settings(self):
         """Loads last used source/destination paths from settings file."""
@@ -28,6 +85,22 @@ class ConfigManager:
                     loaded_dest = settings.get("destination_folder", "")
                     if os.path.isdir(loaded_dest):
                         self.destination_folder = os.path.normpath(loaded_dest)
+
+                    self.copy_options = _merge_with_defaults(settings.get("copy_options", {}), DEFAULT_COPY_OPTIONS,
+                                                             COPY_OPTION_CHOICES)
+                    self.job_queue_settings = _merge_with_defaults(settings.get("job_queue", {}), DEFAULT_JOB_QUEUE_SETTINGS)
+
+                    # Profile folders are kept even if currently missing (e.g. an unplugged card reader)
+                    for name, profile in settings.get("profiles", {}).items():
+                        if not isinstance(profile, dict):
+                            continue
+                        profile_dest = profile.get("destination_folder", "")
+                        self.profiles[name] = {
+                            "source_folders": [os.path.normpath(p) for p in profile.get("source_folders", [])],
+                            "destination_folder": os.path.normpath(profile_dest) if profile_dest else "",
+                            "copy_options": _merge_with_defaults(profile.get("copy_options", {}), DEFAULT_COPY_OPTIONS,
+                                                                 COPY_OPTION_CHOICES)
+                        }
                     
                     logger.info("Settings loaded successfully.")
                     return True
@@ -39,11 +112,16 @@ class ConfigManager:
             logger.info(f"No {SETTINGS_FILE} found. Starting with default paths.")
         return False
 
-    def save_settings(self, source_folders, destination_folder):
-        """Saves current source/destination paths to settings file."""
+    def save_settings(self, source_folders, destination_folder, copy_options=None):
+        """Saves current source/destination paths and copy options to settings file."""
+        if copy_options is not None:
+            self.copy_options = dict(copy_options)
         settings = {
             "source_folders": source_folders,
-            "destination_folder": destination_folder
+            "destination_folder": destination_folder,
+            "copy_options": self.copy_options,
+            "job_queue": self.job_queue_settings,
+            "profiles": self.profiles
         }
         try:
             with open(SETTINGS_FILE, 'w') as f:
@@ -52,4 +130,17 @@ class ConfigManager:
             return True
         except Exception as e:
             logger.error(f"Error saving settings to {SETTINGS_FILE}: {e}")
-        return False
\ No newline at end of file
+        return False
+
+    def save_profile(self, name, source_folders, destination_folder, copy_options):
+        """Stores (or replaces) a named job profile. Call save_settings() to persist it."""
+        self.profiles[name] = {
+            "source_folders": list(source_folders),
+            "destination_folder": destination_folder,
+            "copy_options": _merge_with_defaults(copy_options, DEFAULT_COPY_OPTIONS, COPY_OPTION_CHOICES)
+        }
+        logger.info(f"Profile '{name}' saved.")
+
+    def delete_profile(self, name):
+        if self.profiles.pop(name, None) is not None:
+            logger.info(f"Profile '{name}' deleted.")
@@ -22,6 +22,14 @@ BTN_CANCEL = "Cancel"
 BTN_OPEN_DEST_FOLDER = "Open Destination Folder"
 BTN_OPEN_LOG_FILE = "Open Log File"
 BTN_CLEAR_LOG = "Clear Log Display"
+BTN_DRY_RUN = "Dry Run (Plan)"
+BTN_RUN_PLAN = "Run Saved Plan..."
+BTN_LOAD_PROFILE = "Load"
+BTN_SAVE_PROFILE = "Save As..."
+BTN_DELETE_PROFILE = "Delete"
+BTN_ADD_TO_QUEUE = "Add to Queue"
+BTN_REMOVE_FROM_QUEUE = "Remove from Queue"
+BTN_RUN_QUEUE = "Run Queue"
 
 LBL_SOURCE_FOLDERS = "1. Select Source Folders (Add multiple)"
 LBL_DESTINATION_FOLDER = "2. Select Destination Folder"
@@ -30,6 +38,15 @@ LBL_DESTINATION = "Destination:"
 LBL_PROCESS_LOG = "Process Log"
 LBL_PROGRESS = "Progress: 0/0 files"
 LBL_SCANNING = "Scanning files..."
+LBL_THROUGHPUT = "Throughput"
+LBL_COPY_OPTIONS = "3. Copy Options"
+CHK_ORGANIZE_BY_DATE = "Organize into YYYY/MM/DD folders by capture date"
+LBL_METADATA_POLICY = "Preserve metadata:"
+LBL_ORDERING = "Copy order:"
+LBL_PROFILES_QUEUE = "4. Profiles & Job Queue"
+LBL_PROFILE = "Profile:"
+LBL_CONCURRENT_JOBS = "Concurrent jobs:"
+LBL_IO_SLOTS = "I/O slots:"
 
 MSG_CONFIRM_COPY_TITLE = "Confirm Copy"
 MSG_CONFIRM_CANCEL_TITLE = "Cancel Copy"
@@ -45,6 +62,13 @@ MSG_PROCESS_CANCELLED = "Process Cancelled"
 MSG_PROCESS_FAILED = "Process Failed"
 MSG_SETTINGS_ERROR = "Settings Error"
 MSG_SETTINGS_SAVE_ERROR = "Settings Save Error"
+MSG_PLAN_READY_TITLE = "Copy Plan Ready"
+MSG_RUN_PLAN_TITLE = "Run Saved Plan"
+MSG_PLAN_LOAD_ERROR = "Plan Load Error"
+MSG_NO_PROFILE_SELECTED = "Please select a profile."
+MSG_QUEUE_EMPTY = "The job queue is empty. Add at least one profile to the queue."
+MSG_RUN_QUEUE_TITLE = "Run Job Queue"
+MSG_QUEUE_FINISHED_TITLE = "Job Queue Finished"
 
 STATUS_READY = "Ready."
 STATUS_SCANNING = "Scanning files..."
@@ -53,6 +77,7 @@ STATUS_COMPLETE = "Process complete!"
 STATUS_COMPLETE_ERRORS = "Process complete with errors."
 STATUS_CANCELLED = "Process cancelled."
 STATUS_FAILED = "Process failed."
+STATUS_PLANNED = "Dry run complete."
 
 # Confirmation Messages
 MSG_CONFIRM_REMOVE_FOLDER = "Are you sure you want to remove this folder from the list?"
\ No newline at end of file
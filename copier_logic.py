@@ -4,14 +4,22 @@ import shutil
 import uuid
 import queue
 import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
 from logger_setup import logger, LOG_FILEPATH # <--- CORRECTED: Import LOG_FILEPATH from logger_setup
-from config_manager import IMAGE_EXTENSIONS # Correct: Only IMAGE_EXTENSIONS from config_manager
+from config_manager import IMAGE_EXTENSIONS, DEFAULT_COPY_OPTIONS, METADATA_POLICIES, ORDERING_STRATEGIES
+from metadata_reader import get_capture_datetime
+from file_list import FileList
+from copy_plan import CopyPlan, record_run_throughput, format_size, format_duration
+from copy_stats import StatsSampler
 
-def copy_worker(source_folders, destination_folder, message_queue, cancel_event):
-    """
-    Worker function to perform image copying in a separate thread.
-    Communicates progress and status via a queue.
-    """
+METADATA_WORKERS = 4 # Threads reading EXIF headers ahead of the copy loop
+METADATA_LOOKAHEAD = 64 # Max files whose metadata is read ahead of the file being copied
+
+def _make_senders(message_queue):
+    """Returns the (send_message, send_progress) helpers that report to the UI queue."""
     def send_message(level, message):
         message_queue.put({'level': level, 'message': message})
         if level == "error":
@@ -24,10 +32,214 @@ def copy_worker(source_folders, destination_folder, message_queue, cancel_event)
     def send_progress(current, total, mode="determinate"): # <--- MODIFIED: Added mode parameter
         message_queue.put({'type': 'progress', 'current': current, 'total': total, 'mode': mode}) # <--- MODIFIED: Send mode
 
+    return send_message, send_progress
+
+def _read_capture_datetime(source_path, io_slot):
+    with io_slot:
+        return get_capture_datetime(source_path)
+
+def _iter_with_capture_dates(file_entries, executor, lookahead=METADATA_LOOKAHEAD, pending=None, io_slot=None):
+    """
+    Yields (source_path, size, capture_datetime) in order, while the metadata of
+    the next `lookahead` files is being read in parallel by the executor.
+    `pending` may be passed in so the caller can sample the read-ahead depth.
+    Each read holds `io_slot` (a shared I/O budget) while it has the file open.
+    """
+    pending = deque() if pending is None else pending
+    io_slot = nullcontext() if io_slot is None else io_slot
+    for source_path, size in file_entries:
+        pending.append((source_path, size, executor.submit(_read_capture_datetime, source_path, io_slot)))
+        if len(pending) >= lookahead:
+            path, size, future = pending.popleft()
+            yield path, size, future.result()
+    while pending:
+        path, size, future = pending.popleft()
+        yield path, size, future.result()
+
+def _scan_folder_tree(folder_path, file_list, on_error, record_inodes=False, io_slot=None):
+    """
+    Adds every image file under folder_path to file_list, recording its size
+    (and, if requested, its inode number and its directory's device; free on
+    POSIX apart from one stat per directory, an extra call per file on Windows).
+    Like os.walk, symlinked directories are not followed.
+    Each directory listing holds `io_slot` (a shared I/O budget) while it runs.
+    """
+    io_slot = nullcontext() if io_slot is None else io_slot
+    pending_dirs = [folder_path]
+    while pending_dirs:
+        dir_path = pending_dirs.pop()
+        dir_id = None
+        try:
+            with io_slot, os.scandir(dir_path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir():
+                            if not entry.is_symlink():
+                                pending_dirs.append(entry.path)
+                            continue
+                        if not entry.name.lower().endswith(IMAGE_EXTENSIONS):
+                            continue
+                        size = entry.stat().st_size
+                        inode = entry.inode() if record_inodes else 0
+                    except OSError as e:
+                        on_error(entry.path, e)
+                        continue
+                    if dir_id is None:
+                        dir_id = file_list.intern_dir(dir_path, os.stat(dir_path).st_dev if record_inodes else 0)
+                    file_list.append(dir_id, entry.name, size, inode)
+        except OSError as e:
+            on_error(dir_path, e)
+
+def scan_source_folders(source_folders, file_list, send_message, cancel_event, per_source=None, record_inodes=False,
+                        io_budget=None):
+    """
+    Enumerates the image files of all source folders into file_list.
+    If per_source is a dict, it is filled with {folder: {'files': n, 'bytes': n}}.
+    `io_budget` is an optional semaphore limiting concurrent directory listings.
+    Returns False if the scan was cancelled.
+    """
+    def on_scan_error(path, error):
+        send_message("warning", f"Could not read '{path}', skipping: {error}")
+
+    for folder_path in source_folders:
+        if cancel_event.is_set():
+            return False
+
+        try:
+            folder_path = os.path.abspath(os.path.normpath(folder_path))
+            if not os.path.isdir(folder_path):
+                send_message("warning", f"Source folder not found or is not a directory, skipping: {folder_path}")
+                continue
+            files_before, bytes_before = len(file_list), file_list.total_bytes
+            _scan_folder_tree(folder_path, file_list, on_scan_error, record_inodes, io_budget)
+            if per_source is not None:
+                per_source[folder_path] = {'files': len(file_list) - files_before,
+                                           'bytes': file_list.total_bytes - bytes_before}
+        except Exception as e:
+            send_message("error", f"An unexpected error occurred while enumerating folder '{folder_path}': {e}")
+    return True
+
+def iter_in_copy_order(file_list, ordering):
+    """
+    Ordering stage in front of the copy loop: yields (source_path, size) of
+    file_list in the order given by one of ORDERING_STRATEGIES.
+    """
+    if ordering == 'scan':
+        yield from file_list
+        return
+    dirs = file_list.dirs()
+    if ordering == 'directory':
+        key = lambda entry: (dirs[entry[0]], entry[1])
+    else: # inode; numbers are only comparable within one filesystem
+        devices = file_list.dir_devices()
+        key = lambda entry: (devices[entry[0]], entry[3])
+    for dir_id, name, size, _ in file_list.sorted_entries(key):
+        yield os.path.join(dirs[dir_id], name), size
+
+def build_destination_name(source_path, capture_time):
+    """Returns the 'YYYYMMDD_HHMMSS_UniqueId.ext' filename for a copied file."""
+    extension = os.path.splitext(source_path)[1]
+    return f"{capture_time:%Y%m%d_%H%M%S}_{uuid.uuid4().hex}{extension}"
+
+def build_destination_dir(destination_folder, capture_time, organize_by_date):
+    """Returns the target directory, optionally nested as YYYY/MM/DD."""
+    if not organize_by_date:
+        return destination_folder
+    return os.path.join(destination_folder, f"{capture_time:%Y}", f"{capture_time:%m}", f"{capture_time:%d}")
+
+def copy_file(source_path, destination_path, metadata_policy):
+    """
+    Copies the file data, then only the metadata the policy asks for:
+    'none' adds no syscalls, 'times' one stat and one utime, 'full' is shutil.copy2.
+    Returns the seconds spent on metadata, so each policy's per-file cost can be reported.
+    """
+    shutil.copyfile(source_path, destination_path)
+    if metadata_policy == 'none':
+        return 0.0
+    started = time.perf_counter()
+    if metadata_policy == 'times':
+        st = os.stat(source_path)
+        os.utime(destination_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    else:
+        shutil.copystat(source_path, destination_path)
+    return time.perf_counter() - started
+
+def _scan_snapshot(file_list):
+    """Stats snapshot of a scan that copies nothing (a dry run)."""
+    return {'phase': 'scanning', 'files_scanned': len(file_list), 'metadata_busy': 0, 'files_done': 0, 'bytes_done': 0,
+            'errors': 0, 'skipped_bytes': 0, 'total_files': 0, 'total_bytes': file_list.total_bytes,
+            'metadata_pending': 0}
+
+def plan_worker(source_folders, destination_folder, message_queue, cancel_event, options=None):
+    """
+    Dry run: scans the source folders without copying anything and finishes
+    with a CopyPlan (status 'planned') that the UI can review, save or execute.
+    """
+    options = {**DEFAULT_COPY_OPTIONS, **(options or {})}
+    send_message, send_progress = _make_senders(message_queue)
+
+    send_message("info", "--- Starting Dry Run (no files will be copied) ---")
+    if not source_folders:
+        send_message("warning", "Warning: No source folders selected.")
+        message_queue.put({'type': 'finished', 'status': 'warning'})
+        return
+
+    send_message("info", "Scanning source folders for image files...")
+    send_progress(0, 0, mode="indeterminate")
+
+    file_list = FileList(max_in_memory=options["max_files_in_memory"])
+    per_source = {}
+    sampler = StatsSampler(lambda: _scan_snapshot(file_list), message_queue).start()
+    try:
+        scan_completed = scan_source_folders(source_folders, file_list, send_message, cancel_event, per_source,
+                                             record_inodes=options["ordering"] == 'inode')
+    finally:
+        sampler.stop()
+    if not scan_completed:
+        file_list.close()
+        send_message("warning", "Dry run cancelled during file enumeration.")
+        message_queue.put({'type': 'finished', 'status': 'cancelled'})
+        return
+
+    destination_folder = os.path.abspath(os.path.normpath(destination_folder)) if destination_folder else ""
+    plan = CopyPlan(list(per_source), destination_folder, options, file_list, per_source)
+    send_message("info", "--- Copy Plan ---")
+    for line in plan.summary_lines():
+        send_message("info", line)
+    message_queue.put({'type': 'finished', 'status': 'planned', 'plan': plan,
+                       'copied_count': 0, 'skipped_count': 0})
+
+def copy_worker(source_folders, destination_folder, message_queue, cancel_event, options=None, plan=None, io_budget=None,
+                record_history=True):
+    """
+    Worker function to perform image copying in a separate thread.
+    Communicates progress and status via a queue.
+    `options` holds copy engine settings (see DEFAULT_COPY_OPTIONS).
+    If a CopyPlan is given, its file list is copied instead of rescanning the sources.
+    `io_budget` is an optional semaphore shared with other jobs that limits concurrent file I/O:
+    directory listings, metadata reads and copies each hold one slot.
+    With `record_history` False the run is not added to the throughput history
+    used for plan estimates (benchmarks, or jobs sharing the disk with others).
+    """
+    options = {**DEFAULT_COPY_OPTIONS, **(options or {})}
+    organize_by_date = options["organize_by_date"]
+    metadata_policy = options["metadata_policy"]
+    ordering = options["ordering"]
+    send_message, send_progress = _make_senders(message_queue)
+
     send_message("info", "--- Starting Image Copy Process ---")
     send_message("info", f"Log file for this session: {LOG_FILEPATH}")
 
+    if metadata_policy not in METADATA_POLICIES:
+        send_message("warning", f"Unknown metadata policy '{metadata_policy}', using 'full'.")
+        metadata_policy = 'full'
+    if ordering not in ORDERING_STRATEGIES:
+        send_message("warning", f"Unknown copy order '{ordering}', using 'scan'.")
+        ordering = 'scan'
+
     if not destination_folder:
+        if plan is not None:
+            plan.file_list.close()
         send_message("error", "Error: No destination folder selected.")
         message_queue.put({'type': 'finished', 'status': 'error'})
         return
@@ -40,83 +252,136 @@ def copy_worker(source_folders, destination_folder, message_queue, cancel_event)
         else:
             send_message("info", f"Using existing destination folder: {destination_folder}")
     except OSError as e:
+        if plan is not None:
+            plan.file_list.close()
         send_message("error", f"Error creating/accessing destination folder '{destination_folder}': {e}")
         message_queue.put({'type': 'finished', 'status': 'error'})
         return
 
-    if not source_folders:
-        send_message("warning", "Warning: No source folders selected.")
-        message_queue.put({'type': 'finished', 'status': 'warning'})
-        return
-
-    all_files_to_process = []
-    
-    # --- NEW: Indicate file enumeration start ---
-    send_message("info", "Scanning source folders for image files...")
-    send_progress(0, 0, mode="indeterminate") # <--- NEW: Set indeterminate mode for scanning
-    # --- END NEW ---
-
-    for folder_path in source_folders:
-        if cancel_event.is_set():
-            send_message("warning", "Process cancelled during file enumeration.")
-            message_queue.put({'type': 'finished', 'status': 'cancelled'})
+    if plan is not None:
+        file_list = plan.file_list
+        send_message("info", f"Executing saved plan from {plan.created}; skipping the source scan.")
+    else:
+        if not source_folders:
+            send_message("warning", "Warning: No source folders selected.")
+            message_queue.put({'type': 'finished', 'status': 'warning'})
             return
 
-        try:
-            folder_path = os.path.abspath(os.path.normpath(folder_path))
-            if not os.path.isdir(folder_path):
-                send_message("warning", f"Source folder not found or is not a directory, skipping: {folder_path}")
-                continue
-            
-            # Removed the "Enumerating files in..." message here, as the general "Scanning..." covers it
-            for root, _, files in os.walk(folder_path):
-                for filename in files:
-                    if filename.lower().endswith(IMAGE_EXTENSIONS):
-                        all_files_to_process.append(os.path.join(root, filename))
-        except PermissionError as e:
-            send_message("error", f"Permission denied accessing folder '{folder_path}': {e}")
-        except Exception as e:
-            send_message("error", f"An unexpected error occurred while enumerating folder '{folder_path}': {e}")
-            
-    total_files_to_copy = len(all_files_to_process)
+        file_list = FileList(max_in_memory=options["max_files_in_memory"])
+
+    phase = 'scanning' if plan is None else 'copying'
+    total_files_to_copy = 0
     copied_count = 0
+    copied_bytes = 0
     skipped_count = 0
-    
-    # --- NEW: Indicate enumeration complete and switch to determinate mode ---
-    send_message("info", f"Finished scanning. Found {total_files_to_copy} potential image files to copy.")
-    send_progress(0, total_files_to_copy, mode="determinate") # <--- NEW: Switch to determinate mode with total
-    # --- END NEW ---
+    skipped_bytes = 0
+    metadata_seconds = 0.0
+    pending_metadata = deque()
 
-    for i, source_path in enumerate(all_files_to_process):
-        if cancel_event.is_set():
-            send_message("warning", "Process cancelled during file copying.")
-            message_queue.put({'type': 'finished', 'status': 'cancelled'})
-            return
+    def snapshot():
+        """Counters read by the StatsSampler thread; the copy loop itself never sends stats."""
+        read_ahead = tuple(pending_metadata) # Copied in one step; the copy loop keeps changing the deque
+        return {'phase': phase, 'files_scanned': len(file_list),
+                'metadata_busy': sum(1 for _, _, future in read_ahead if future.running()),
+                'files_done': copied_count + skipped_count, 'bytes_done': copied_bytes,
+                'errors': skipped_count, 'skipped_bytes': skipped_bytes,
+                'total_files': total_files_to_copy, 'total_bytes': file_list.total_bytes,
+                'metadata_pending': len(pending_metadata)}
 
-        send_progress(i + 1, total_files_to_copy) # <--- Keep sending determinate progress
+    # Stats are sampled on a timer, so a long scan or a stalled file still updates the panel
+    sampler = StatsSampler(snapshot, message_queue).start()
+    try:
+        if plan is None:
+            # --- NEW: Indicate file enumeration start ---
+            send_message("info", "Scanning source folders for image files...")
+            send_progress(0, 0, mode="indeterminate") # <--- NEW: Set indeterminate mode for scanning
+            # --- END NEW ---
+
+            if not scan_source_folders(source_folders, file_list, send_message, cancel_event,
+                                       record_inodes=ordering == 'inode', io_budget=io_budget):
+                sampler.stop()
+                send_message("warning", "Process cancelled during file enumeration.")
+                message_queue.put({'type': 'finished', 'status': 'cancelled'})
+                return
+
+        total_files_to_copy = len(file_list)
+        phase = 'copying'
 
-        extension = os.path.splitext(os.path.basename(source_path))[1]
-        unique_id = uuid.uuid4().hex
-        new_filename = f"{unique_id}{extension}"
-        
-        destination_path = os.path.join(destination_folder, new_filename)
-        
+        # --- NEW: Indicate enumeration complete and switch to determinate mode ---
+        send_message("info", f"Finished scanning. Found {total_files_to_copy} potential image files to copy ({format_size(file_list.total_bytes)}).")
+        send_progress(0, total_files_to_copy, mode="determinate") # <--- NEW: Switch to determinate mode with total
+        # --- END NEW ---
+
+        if organize_by_date:
+            send_message("info", "Organizing copies into YYYY/MM/DD folders by capture date.")
+        if ordering != 'scan':
+            send_message("info", f"Copying in '{ordering}' order.")
+        created_dirs = {destination_folder}
+        io_slot = io_budget if io_budget is not None else nullcontext()
+        start_time = time.monotonic()
+
+        # Capture dates (EXIF or mtime) are read by a small thread pool running ahead of the copy loop
+        executor = ThreadPoolExecutor(max_workers=METADATA_WORKERS, thread_name_prefix="metadata")
+        copy_entries = _iter_with_capture_dates(iter_in_copy_order(file_list, ordering), executor,
+                                                pending=pending_metadata, io_slot=io_slot)
         try:
-            shutil.copy2(source_path, destination_path)
-            copied_count += 1
-            send_message("info", f"  Copied '{os.path.basename(source_path)}' as '{new_filename}'")
-        except (shutil.Error, OSError) as e:
-            send_message("error", f"  Error copying '{os.path.basename(source_path)}' to '{destination_path}': {e}")
-            skipped_count += 1
-        except Exception as e:
-            send_message("error", f"  An unexpected error occurred while copying '{os.path.basename(source_path)}': {e}")
-            skipped_count += 1
+            for i, (source_path, size, capture_time) in enumerate(copy_entries):
+                if cancel_event.is_set():
+                    sampler.stop()
+                    send_message("warning", "Process cancelled during file copying.")
+                    message_queue.put({'type': 'finished', 'status': 'cancelled'})
+                    return
+
+                send_progress(i + 1, total_files_to_copy) # <--- Keep sending determinate progress
+
+                new_filename = build_destination_name(source_path, capture_time)
+                target_dir = build_destination_dir(destination_folder, capture_time, organize_by_date)
+                destination_path = os.path.join(target_dir, new_filename)
+
+                try:
+                    if target_dir not in created_dirs:
+                        os.makedirs(target_dir, exist_ok=True)
+                        created_dirs.add(target_dir)
+                    with io_slot:
+                        metadata_seconds += copy_file(source_path, destination_path, metadata_policy)
+                    copied_count += 1
+                    copied_bytes += size
+                    send_message("info", f"  Copied '{os.path.basename(source_path)}' as '{os.path.relpath(destination_path, destination_folder)}'")
+                except (shutil.Error, OSError) as e:
+                    send_message("error", f"  Error copying '{os.path.basename(source_path)}' to '{destination_path}': {e}")
+                    skipped_count += 1
+                    skipped_bytes += size
+                except Exception as e:
+                    send_message("error", f"  An unexpected error occurred while copying '{os.path.basename(source_path)}': {e}")
+                    skipped_count += 1
+                    skipped_bytes += size
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+    except Exception as e:
+        # Failures outside a single file's copy (ordering, metadata read-ahead, ...) end the run
+        # with a 'finished' message so the UI never waits on a dead worker
+        sampler.stop()
+        send_message("error", f"An unexpected error stopped the copy process after {copied_count} file(s): {e}")
+        message_queue.put({'type': 'finished', 'status': 'error', 'copied_count': copied_count,
+                           'skipped_count': skipped_count, 'copied_bytes': copied_bytes})
+        return
+    finally:
+        # The final (not running) snapshot goes out before any 'finished' message
+        sampler.stop()
+        file_list.close()
+
+    elapsed = time.monotonic() - start_time
+    if record_history:
+        record_run_throughput(copied_count, copied_bytes, elapsed)
 
     final_status = 'completed' if skipped_count == 0 else 'completed_with_errors'
     send_message("info", "\n--- Finished Image Copy Process ---")
     send_message("info", f"Total files identified: {total_files_to_copy}")
-    send_message("info", f"Total image files copied successfully: {copied_count}")
+    send_message("info", f"Total image files copied successfully: {copied_count} ({format_size(copied_bytes)} in {format_duration(elapsed)})")
+    if copied_count:
+        send_message("info", f"Metadata policy '{metadata_policy}': {metadata_seconds * 1000 / copied_count:.3f} ms per file")
     if skipped_count > 0:
         send_message("warning", f"Total files skipped due to errors: {skipped_count}")
 
-    message_queue.put({'type': 'finished', 'status': final_status, 'copied_count': copied_count, 'skipped_count': skipped_count})
\ No newline at end of file
+    message_queue.put({'type': 'finished', 'status': final_status, 'copied_count': copied_count, 'skipped_count': skipped_count,
+                       'copied_bytes': copied_bytes, 'elapsed_seconds': elapsed, 'metadata_seconds': metadata_seconds})
\ No newline at end of file
@@ -0,0 +1,179 @@
+# copy_plan.py
+import datetime
+import json
+import os
+import threading
+from logger_setup import logger
+from config_manager import THROUGHPUT_HISTORY_FILE
+from file_list import FileList, DEFAULT_MAX_FILES_IN_MEMORY
+
+PLAN_FILE_EXTENSION = ".plan.jsonl"
+PLAN_FORMAT_VERSION = 1
+THROUGHPUT_HISTORY_LIMIT = 20 # Most recent runs used for duration estimates
+_history_lock = threading.Lock() # Queued jobs may finish concurrently
+
+def load_throughput_history():
+    """Returns the recorded runs as a list of {'files', 'bytes', 'seconds'} dicts."""
+    if not os.path.exists(THROUGHPUT_HISTORY_FILE):
+        return []
+    try:
+        with open(THROUGHPUT_HISTORY_FILE, 'r') as f:
+            runs = json.load(f)
+        return [run for run in runs if run.get("seconds", 0) > 0 and run.get("files", 0) > 0]
+    except (json.JSONDecodeError, OSError, AttributeError, TypeError) as e:
+        logger.error(f"Error reading {THROUGHPUT_HISTORY_FILE}: {e}")
+        return []
+
+def record_run_throughput(files, total_bytes, seconds):
+    """Appends a finished run to the throughput history used by estimate_duration()."""
+    if files <= 0 or seconds <= 0:
+        return
+    with _history_lock:
+        runs = load_throughput_history()
+        runs.append({
+            "files": files,
+            "bytes": total_bytes,
+            "seconds": round(seconds, 3),
+            "finished": datetime.datetime.now().isoformat(timespec="seconds")
+        })
+        try:
+            with open(THROUGHPUT_HISTORY_FILE, 'w') as f:
+                json.dump(runs[-THROUGHPUT_HISTORY_LIMIT:], f, indent=4)
+        except OSError as e:
+            logger.error(f"Error saving throughput history to {THROUGHPUT_HISTORY_FILE}: {e}")
+
+def estimate_duration(total_files, total_bytes, history=None):
+    """
+    Estimates the copy time in seconds from the recorded runs, or None without history.
+    Both the per-file and the per-byte rate are applied and the slower result is used,
+    so jobs of many small files and jobs of few large files are both covered.
+    """
+    runs = load_throughput_history() if history is None else history
+    if not runs:
+        return None
+    seconds = sum(run["seconds"] for run in runs)
+    files = sum(run["files"] for run in runs)
+    estimate = total_files * seconds / files
+    run_bytes = sum(run.get("bytes", 0) for run in runs)
+    if run_bytes > 0:
+        estimate = max(estimate, total_bytes * seconds / run_bytes)
+    return estimate
+
+def format_duration(seconds):
+    if seconds is None:
+        return "unknown (no previous runs recorded)"
+    seconds = int(round(seconds))
+    hours, remainder = divmod(seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    if hours:
+        return f"{hours}h {minutes:02d}m {seconds:02d}s"
+    if minutes:
+        return f"{minutes}m {seconds:02d}s"
+    return f"{seconds}s"
+
+def format_size(num_bytes):
+    return f"{num_bytes / (1024 * 1024):.1f} MB"
+
+def _is_uint64(value):
+    return isinstance(value, int) and not isinstance(value, bool) and 0 <= value < 2 ** 64
+
+def _is_str_list(value):
+    return isinstance(value, list) and all(isinstance(item, str) for item in value)
+
+def _is_dir_record(record):
+    """["d", dir_id, path] or ["d", dir_id, path, device]"""
+    return (isinstance(record, list) and len(record) in (3, 4) and record[0] == "d"
+            and _is_uint64(record[1]) and isinstance(record[2], str) and all(map(_is_uint64, record[3:])))
+
+def _is_file_record(record):
+    """["f", dir_id, name, size] or ["f", dir_id, name, size, inode]"""
+    return (isinstance(record, list) and len(record) in (4, 5) and record[0] == "f"
+            and _is_uint64(record[1]) and isinstance(record[2], str) and all(map(_is_uint64, record[3:])))
+
+class CopyPlan:
+    """
+    The result of a dry run: the scanned work list plus the job settings,
+    which can be reviewed, saved and later executed without rescanning.
+    """
+    def __init__(self, source_folders, destination_folder, options, file_list, per_source, created=None):
+        self.source_folders = list(source_folders)
+        self.destination_folder = destination_folder
+        self.options = dict(options)
+        self.file_list = file_list
+        self.per_source = per_source # {source_folder: {'files': n, 'bytes': n}}
+        self.created = created or datetime.datetime.now().isoformat(timespec="seconds")
+
+    @property
+    def total_files(self):
+        return len(self.file_list)
+
+    @property
+    def total_bytes(self):
+        return self.file_list.total_bytes
+
+    def estimate_seconds(self, history=None):
+        return estimate_duration(self.total_files, self.total_bytes, history)
+
+    def summary_lines(self):
+        """Human-readable plan summary for the process log."""
+        lines = [
+            f"Plan created: {self.created}",
+            f"Destination: {self.destination_folder}",
+            f"Files to copy: {self.total_files} ({format_size(self.total_bytes)})",
+        ]
+        for folder, stats in self.per_source.items():
+            lines.append(f"  {folder}: {stats['files']} files ({format_size(stats['bytes'])})")
+        lines.append(f"Estimated duration: {format_duration(self.estimate_seconds())}")
+        return lines
+
+    def save(self, plan_path):
+        """Writes the plan as JSON lines: a header, then directories, then files."""
+        header = {
+            "version": PLAN_FORMAT_VERSION,
+            "created": self.created,
+            "source_folders": self.source_folders,
+            "destination_folder": self.destination_folder,
+            "options": self.options,
+            "per_source": self.per_source,
+            "total_files": self.total_files,
+            "total_bytes": self.total_bytes,
+        }
+        with open(plan_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(header) + "\n")
+            for dir_id, (dir_path, device) in enumerate(zip(self.file_list.dirs(), self.file_list.dir_devices())):
+                f.write(json.dumps(["d", dir_id, dir_path, device]) + "\n")
+            for dir_id, name, size, inode in self.file_list.iter_entries():
+                f.write(json.dumps(["f", dir_id, name, size, inode]) + "\n")
+        logger.info(f"Saved copy plan with {self.total_files} files to {plan_path}")
+
+    @classmethod
+    def load(cls, plan_path, max_in_memory=DEFAULT_MAX_FILES_IN_MEMORY):
+        """Reads a plan written by save(). Raises ValueError for unsupported or malformed files."""
+        with open(plan_path, 'r', encoding='utf-8') as f:
+            header = json.loads(f.readline() or "{}")
+            if not isinstance(header, dict) or header.get("version") != PLAN_FORMAT_VERSION:
+                raise ValueError(f"Unsupported or missing plan format version in '{plan_path}'.")
+            if not (_is_str_list(header.get("source_folders")) and isinstance(header.get("destination_folder"), str)
+                    and isinstance(header.get("options", {}), dict) and isinstance(header.get("per_source", {}), dict)):
+                raise ValueError(f"Malformed header in plan '{plan_path}'.")
+            file_list = FileList(max_in_memory=max_in_memory)
+            dir_count = 0
+            try:
+                for line_number, line in enumerate(f, start=2):
+                    record = json.loads(line)
+                    if _is_file_record(record):
+                        if record[1] >= dir_count:
+                            raise ValueError(f"File record on line {line_number} refers to an undefined directory "
+                                             f"in plan '{plan_path}'.")
+                        file_list.append(*record[1:])
+                    elif _is_dir_record(record):
+                        if file_list.intern_dir(*record[2:]) != record[1]:
+                            raise ValueError(f"Corrupt directory table in plan '{plan_path}'.")
+                        dir_count += 1
+                    else:
+                        raise ValueError(f"Malformed record on line {line_number} of plan '{plan_path}'.")
+            except Exception:
+                file_list.close()
+                raise
+        return cls(header["source_folders"], header["destination_folder"], header.get("options", {}),
+                   file_list, header.get("per_source", {}), header.get("created"))
@@ -0,0 +1,116 @@
+# copy_stats.py
+import threading
+import time
+from collections import deque
+
+STATS_INTERVAL = 1.0 # Seconds between 'stats' snapshots sent by a copy worker's sampler
+RATE_WINDOW = 5.0 # Seconds of snapshots used for the instantaneous rates
+_MB = 1024 * 1024
+
+class StatsSampler:
+    """
+    Background thread that puts a 'stats' message built from `snapshot()` on the
+    message queue every `interval` seconds, independently of per-file progress,
+    so the panel keeps updating during the scan and while a large file is copied.
+    """
+    def __init__(self, snapshot, message_queue, interval=STATS_INTERVAL):
+        self._snapshot = snapshot
+        self._message_queue = message_queue
+        self._interval = interval
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stats-sampler", daemon=True)
+
+    def _send(self, running):
+        self._message_queue.put({'type': 'stats', 'running': running, **self._snapshot()})
+
+    def _run(self):
+        while not self._stopped.wait(self._interval):
+            self._send(running=True)
+
+    def start(self):
+        self._send(running=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stops sampling and sends one final snapshot marked as not running. Safe to call twice."""
+        if self._stopped.is_set():
+            return
+        self._stopped.set()
+        self._thread.join()
+        self._send(running=False)
+
+class ThroughputMonitor:
+    """
+    Aggregates the sampled 'stats' snapshots of one or more copy workers
+    (keyed by job, None for a single copy) into the figures shown in the UI.
+    Workers keep sending snapshots while stalled, so the instantaneous rates
+    fall to 0 once no progress has been made for RATE_WINDOW seconds.
+    """
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self._snapshots = {}
+        self._history = deque() # (time, bytes_done, files_done) of the aggregate
+        self._started = None # First sample taken while copying; averages exclude the scan
+
+    def update(self, snapshot, source=None, now=None):
+        """Records the latest snapshot of one worker."""
+        now = time.monotonic() if now is None else now
+        if self._started is None and snapshot.get('phase', 'copying') == 'copying':
+            self._started = now
+        self._snapshots[source] = snapshot
+        bytes_done = sum(s['bytes_done'] for s in self._snapshots.values())
+        files_done = sum(s['files_done'] for s in self._snapshots.values())
+        self._history.append((now, bytes_done, files_done))
+        while len(self._history) > 2 and now - self._history[0][0] > RATE_WINDOW:
+            self._history.popleft()
+
+    def summary(self):
+        """Returns the current rates, worker counts, error rate and ETA (seconds or None)."""
+        snapshots = list(self._snapshots.values())
+        files_done = sum(s['files_done'] for s in snapshots)
+        bytes_done = sum(s['bytes_done'] for s in snapshots)
+        errors = sum(s['errors'] for s in snapshots)
+        remaining_files = sum(s['total_files'] - s['files_done'] for s in snapshots)
+        remaining_bytes = sum(max(0, s['total_bytes'] - s['bytes_done'] - s['skipped_bytes']) for s in snapshots)
+        scanning = [s for s in snapshots if s['running'] and s.get('phase') == 'scanning']
+        copying = [s for s in snapshots if s['running'] and s.get('phase', 'copying') == 'copying']
+        metadata_busy = sum(s.get('metadata_busy', 0) for s in copying)
+
+        instant_bps = instant_fps = average_bps = average_fps = 0.0
+        if len(self._history) >= 2:
+            (t0, b0, f0), (t1, b1, f1) = self._history[0], self._history[-1]
+            if t1 > t0:
+                instant_bps = (b1 - b0) / (t1 - t0)
+                instant_fps = (f1 - f0) / (t1 - t0)
+            if self._started is not None and t1 > self._started:
+                average_bps = bytes_done / (t1 - self._started)
+                average_fps = files_done / (t1 - self._started)
+
+        eta = None # Also while scanning: the total is unknown until every running scan is done
+        if not scanning:
+            if remaining_files == 0 and snapshots:
+                eta = 0.0
+            elif remaining_bytes and instant_bps > 0:
+                eta = remaining_bytes / instant_bps
+            elif instant_fps > 0:
+                eta = remaining_files / instant_fps
+
+        return {
+            'instant_mbps': instant_bps / _MB,
+            'instant_fps': instant_fps,
+            'average_mbps': average_bps / _MB,
+            'average_fps': average_fps,
+            'active_workers': len(copying) + metadata_busy + len(scanning), # Busy threads, not jobs
+            'copying_workers': len(copying), # One copy loop per running job
+            'metadata_workers': metadata_busy, # Metadata reader threads with a read in progress
+            'scanning_workers': len(scanning),
+            'files_scanned': sum(s.get('files_scanned', 0) for s in scanning),
+            'metadata_pending': sum(s['metadata_pending'] for s in snapshots),
+            'remaining_files': remaining_files,
+            'errors': errors,
+            'error_rate': errors / files_done if files_done else 0.0,
+            'eta_seconds': eta,
+        }
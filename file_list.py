@@ -0,0 +1,153 @@
+# file_list.py
+import array
+import heapq
+import os
+import struct
+import tempfile
+from logger_setup import logger
+
+DEFAULT_MAX_FILES_IN_MEMORY = 1_000_000 # Entries held in memory before spilling to disk
+_RECORD_HEADER = struct.Struct("<IQQH") # dir_id, size, inode, basename length
+
+def _encode_records(entries):
+    records = []
+    for dir_id, name, size, inode in entries:
+        encoded_name = os.fsencode(name)
+        records.append(_RECORD_HEADER.pack(dir_id, size, inode, len(encoded_name)))
+        records.append(encoded_name)
+    return b"".join(records)
+
+def _read_records(f, count):
+    """Yields count (dir_id, basename, size, inode) records from the current position of f."""
+    read = f.read
+    for _ in range(count):
+        dir_id, size, inode, name_length = _RECORD_HEADER.unpack(read(_RECORD_HEADER.size))
+        yield dir_id, os.fsdecode(read(name_length)), size, inode
+
+class FileList:
+    """
+    Append-only, memory-compact list of the files to process.
+
+    Directory prefixes are interned once (with the device they live on, when
+    known) and each entry is stored as
+    (dir_id, basename, size, inode) in parallel arrays instead of a full path string.
+    When more than `max_in_memory` entries are buffered they are flushed to an
+    anonymous temporary file; 0 keeps everything in memory.
+    Appending while iterating is not supported, and after close() the entries
+    can no longer be appended or read (len() and total_bytes stay available).
+    """
+    __slots__ = ('_dirs', '_dir_ids', '_dir_devices', '_entry_dirs', '_entry_sizes', '_entry_inodes', '_entry_names',
+                 '_max_in_memory', '_spill_file', '_spill_chunks', '_spilled_count', '_closed', 'total_bytes')
+
+    def __init__(self, max_in_memory=DEFAULT_MAX_FILES_IN_MEMORY):
+        self._dirs = []
+        self._dir_ids = {}
+        self._dir_devices = array.array('Q')
+        self._entry_dirs = array.array('I')
+        self._entry_sizes = array.array('Q')
+        self._entry_inodes = array.array('Q')
+        self._entry_names = []
+        self._max_in_memory = max_in_memory
+        self._spill_file = None
+        self._spill_chunks = [] # (offset, count) of each flushed chunk
+        self._spilled_count = 0
+        self._closed = False
+        self.total_bytes = 0
+
+    def _check_open(self):
+        if self._closed:
+            raise ValueError("I/O operation on a closed FileList.")
+
+    def intern_dir(self, dir_path, device=0):
+        """Returns the id of dir_path, registering it (and its st_dev) on first use."""
+        dir_id = self._dir_ids.get(dir_path)
+        if dir_id is None:
+            dir_id = len(self._dirs)
+            self._dirs.append(dir_path)
+            self._dir_devices.append(device)
+            self._dir_ids[dir_path] = dir_id
+        return dir_id
+
+    def dirs(self):
+        """Returns the interned directories, indexed by dir_id."""
+        return list(self._dirs)
+
+    def dir_devices(self):
+        """Returns the device number of each interned directory (0 if not recorded), indexed by dir_id."""
+        return list(self._dir_devices)
+
+    def append(self, dir_id, name, size, inode=0):
+        self._check_open()
+        self._entry_dirs.append(dir_id)
+        self._entry_sizes.append(size)
+        self._entry_inodes.append(inode)
+        self._entry_names.append(name)
+        self.total_bytes += size
+        if self._max_in_memory and len(self._entry_names) >= self._max_in_memory:
+            self._spill()
+
+    def _in_memory_entries(self):
+        return zip(self._entry_dirs, self._entry_names, self._entry_sizes, self._entry_inodes)
+
+    def _spill(self):
+        """Moves the in-memory entries to the end of the spill file."""
+        if self._spill_file is None:
+            self._spill_file = tempfile.TemporaryFile(prefix="image_copier_filelist_")
+            logger.info(f"File list reached {self._max_in_memory} entries; spilling to a temporary file.")
+        self._spill_file.seek(0, os.SEEK_END)
+        self._spill_chunks.append((self._spill_file.tell(), len(self._entry_names)))
+        self._spill_file.write(_encode_records(self._in_memory_entries()))
+        self._spilled_count += len(self._entry_names)
+        self._entry_dirs = array.array('I')
+        self._entry_sizes = array.array('Q')
+        self._entry_inodes = array.array('Q')
+        self._entry_names = []
+
+    def __len__(self):
+        return self._spilled_count + len(self._entry_names)
+
+    def iter_entries(self):
+        """Yields (dir_id, basename, size, inode) in insertion order."""
+        self._check_open()
+        if self._spill_file is not None:
+            self._spill_file.seek(0)
+            yield from _read_records(self._spill_file, self._spilled_count)
+        yield from self._in_memory_entries()
+
+    def sorted_entries(self, key):
+        """
+        Yields (dir_id, basename, size, inode) ordered by key(entry).
+        Spilled chunks are sorted one at a time into temporary runs that are
+        then merged, so memory stays bounded by max_in_memory entries.
+        """
+        self._check_open()
+        run_files = []
+        runs = []
+        try:
+            for offset, count in self._spill_chunks:
+                self._spill_file.seek(offset)
+                chunk = sorted(_read_records(self._spill_file, count), key=key)
+                run_file = tempfile.TemporaryFile(prefix="image_copier_sortrun_")
+                run_file.write(_encode_records(chunk))
+                run_file.seek(0)
+                del chunk
+                run_files.append(run_file)
+                runs.append(_read_records(run_file, count))
+            runs.append(iter(sorted(self._in_memory_entries(), key=key)))
+            yield from heapq.merge(*runs, key=key)
+        finally:
+            for run_file in run_files:
+                run_file.close()
+
+    def __iter__(self):
+        """Yields (full_path, size) in insertion order."""
+        dirs = self._dirs
+        for dir_id, name, size, _ in self.iter_entries():
+            yield os.path.join(dirs[dir_id], name), size
+
+    def close(self):
+        """Releases the spill file, if any. The list cannot be read afterwards."""
+        self._closed = True
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
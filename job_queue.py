@@ -0,0 +1,102 @@
+# job_queue.py
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from logger_setup import logger
+from copier_logic import copy_worker, METADATA_WORKERS
+
+IO_SLOTS_PER_JOB = METADATA_WORKERS + 1 # Metadata readers plus the copy loop of one job
+
+class CopyJob:
+    """One queued run of a settings profile."""
+    def __init__(self, name, source_folders, destination_folder, options):
+        self.name = name
+        self.source_folders = list(source_folders)
+        self.destination_folder = destination_folder
+        self.options = dict(options)
+        self.status = 'queued'
+        self.current = 0
+        self.total = 0
+        self.copied_count = 0
+        self.skipped_count = 0
+
+    @classmethod
+    def from_profile(cls, name, profile):
+        return cls(name, profile["source_folders"], profile["destination_folder"], profile["copy_options"])
+
+    def describe(self):
+        """Single-line description for the queue list."""
+        text = f"{self.name} -> {self.destination_folder} [{self.status}]"
+        if self.status == 'running' and self.total:
+            text += f" {self.current}/{self.total}"
+        elif self.status in ('completed', 'completed_with_errors'):
+            text += f" copied {self.copied_count}, skipped {self.skipped_count}"
+        return text
+
+class JobMessageQueue:
+    """
+    Queue-like adapter given to copy_worker in place of the UI queue.
+    Tags every message with the job index so the UI can tell concurrent jobs apart.
+    """
+    def __init__(self, message_queue, job_index, job):
+        self._message_queue = message_queue
+        self._job_index = job_index
+        self._job = job
+
+    def put(self, message):
+        if message.get('type') == 'finished':
+            self._job.status = message.get('status', 'error')
+            self._job.copied_count = message.get('copied_count', 0)
+            self._job.skipped_count = message.get('skipped_count', 0)
+        self._message_queue.put({**message, 'job': self._job_index, 'job_name': self._job.name})
+
+def clamp_io_concurrency(max_concurrent_jobs, io_concurrency):
+    """Limits the I/O budget to what the running jobs can actually use at once."""
+    return min(max(1, io_concurrency), max(1, max_concurrent_jobs) * IO_SLOTS_PER_JOB)
+
+def _run_job(job_index, job, message_queue, cancel_event, io_budget, record_history):
+    if cancel_event.is_set():
+        job.status = 'cancelled'
+        message_queue.put({'type': 'job_status', 'job': job_index, 'job_name': job.name, 'status': job.status})
+        return
+    job.status = 'running'
+    message_queue.put({'type': 'job_status', 'job': job_index, 'job_name': job.name, 'status': job.status})
+    try:
+        copy_worker(job.source_folders, job.destination_folder, JobMessageQueue(message_queue, job_index, job),
+                    cancel_event, job.options, io_budget=io_budget, record_history=record_history)
+    except Exception as e:
+        logger.error(f"Job '{job.name}' failed unexpectedly: {e}")
+        job.status = 'error'
+        message_queue.put({'type': 'finished', 'status': 'error', 'job': job_index, 'job_name': job.name})
+
+def queue_worker(jobs, message_queue, cancel_event, max_concurrent_jobs=1, io_concurrency=4):
+    """
+    Runs the queued jobs, at most `max_concurrent_jobs` at a time (1 = back to back).
+    All jobs share one budget of `io_concurrency` simultaneous file operations
+    (directory listings, metadata reads and copies), clamped by clamp_io_concurrency().
+    Per-job messages go through the usual protocol tagged with 'job'; a final
+    'queue_finished' message reports the outcome of every job.
+    Jobs running back to back record their own throughput; concurrent jobs
+    contend for the disk, so their rates are not recorded at all.
+    """
+    usable_slots = clamp_io_concurrency(max_concurrent_jobs, io_concurrency)
+    if usable_slots != io_concurrency:
+        logger.warning(f"{io_concurrency} I/O slots requested; {max_concurrent_jobs} concurrent job(s) can use "
+                       f"{usable_slots}.")
+        io_concurrency = usable_slots
+    io_budget = threading.BoundedSemaphore(io_concurrency)
+    logger.info(f"Starting job queue: {len(jobs)} job(s), {max_concurrent_jobs} concurrent, {io_concurrency} I/O slots.")
+    jobs_record_history = max_concurrent_jobs <= 1
+    with ThreadPoolExecutor(max_workers=max(1, max_concurrent_jobs), thread_name_prefix="copy-job") as pool:
+        for job_index, job in enumerate(jobs):
+            pool.submit(_run_job, job_index, job, message_queue, cancel_event, io_budget, jobs_record_history)
+
+    results = [{'name': job.name, 'status': job.status, 'copied_count': job.copied_count,
+                'skipped_count': job.skipped_count} for job in jobs]
+    if cancel_event.is_set():
+        status = 'cancelled'
+    elif all(job.status == 'completed' for job in jobs):
+        status = 'completed'
+    else:
+        status = 'completed_with_errors'
+    logger.info(f"Job queue finished with status '{status}'.")
+    message_queue.put({'type': 'queue_finished', 'status': status, 'results': results})
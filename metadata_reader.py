@@ -0,0 +1,144 @@
+# metadata_reader.py
+import datetime
+import os
+import struct
+from logger_setup import logger
+
+# Formats this parser understands; other images go straight to the mtime fallback without being opened
+EXIF_EXTENSIONS = ('.jpg', '.jpeg', '.tif', '.tiff')
+# Buffered read size: the EXIF segment normally sits in the first few KB of a JPEG
+EXIF_CHUNK_BYTES = 8 * 1024
+# Stop walking JPEG segments (or reading a TIFF header) past this offset
+EXIF_MAX_BYTES = 64 * 1024
+EXIF_DATETIME_FORMAT = "%Y:%m:%d %H:%M:%S"
+
+TAG_DATETIME = 0x0132
+TAG_EXIF_IFD_POINTER = 0x8769
+TAG_DATETIME_ORIGINAL = 0x9003
+TYPE_ASCII = 2
+
+def _iter_ifd_entries(tiff, offset, endian):
+    """Yields (tag, type, count, value_position) for each entry of the IFD at offset."""
+    if offset + 2 > len(tiff):
+        return
+    (entry_count,) = struct.unpack_from(endian + "H", tiff, offset)
+    for i in range(entry_count):
+        entry_pos = offset + 2 + i * 12
+        if entry_pos + 12 > len(tiff):
+            return
+        tag, value_type, count = struct.unpack_from(endian + "HHI", tiff, entry_pos)
+        yield tag, value_type, count, entry_pos + 8
+
+def _read_ascii_value(tiff, count, value_pos, endian):
+    """Reads an ASCII tag value, which is stored inline when it fits in 4 bytes."""
+    if count <= 4:
+        raw = tiff[value_pos:value_pos + count]
+    else:
+        (value_offset,) = struct.unpack_from(endian + "I", tiff, value_pos)
+        raw = tiff[value_offset:value_offset + count]
+    return raw.split(b"\x00", 1)[0].decode("ascii", errors="ignore").strip()
+
+def _parse_exif_timestamp(value):
+    if not value:
+        return None
+    try:
+        return datetime.datetime.strptime(value, EXIF_DATETIME_FORMAT)
+    except ValueError:
+        return None
+
+def _parse_tiff_datetime(tiff):
+    """Returns DateTimeOriginal (or DateTime as a fallback) from a TIFF-structured block."""
+    if len(tiff) < 8:
+        return None
+    if tiff[:2] == b"II":
+        endian = "<"
+    elif tiff[:2] == b"MM":
+        endian = ">"
+    else:
+        return None
+
+    (ifd0_offset,) = struct.unpack_from(endian + "I", tiff, 4)
+    fallback_value = None
+    exif_ifd_offset = None
+    for tag, value_type, count, value_pos in _iter_ifd_entries(tiff, ifd0_offset, endian):
+        if tag == TAG_DATETIME and value_type == TYPE_ASCII:
+            fallback_value = _read_ascii_value(tiff, count, value_pos, endian)
+        elif tag == TAG_EXIF_IFD_POINTER:
+            (exif_ifd_offset,) = struct.unpack_from(endian + "I", tiff, value_pos)
+
+    if exif_ifd_offset is not None:
+        for tag, value_type, count, value_pos in _iter_ifd_entries(tiff, exif_ifd_offset, endian):
+            if tag == TAG_DATETIME_ORIGINAL and value_type == TYPE_ASCII:
+                original = _parse_exif_timestamp(_read_ascii_value(tiff, count, value_pos, endian))
+                if original:
+                    return original
+                break
+
+    return _parse_exif_timestamp(fallback_value)
+
+def _read_jpeg_exif_block(f):
+    """
+    Walks the JPEG marker segments of an open file and returns the TIFF block
+    of the EXIF APP1 segment. Segments before it are skipped with a seek, so
+    only the bytes up to the end of the EXIF segment are read.
+    """
+    if f.read(2) != b"\xFF\xD8": # SOI
+        return None
+    while f.tell() < EXIF_MAX_BYTES:
+        marker_bytes = f.read(2)
+        if len(marker_bytes) < 2 or marker_bytes[0] != 0xFF:
+            return None
+        marker = marker_bytes[1]
+        while marker == 0xFF: # Fill bytes
+            next_byte = f.read(1)
+            if not next_byte:
+                return None
+            marker = next_byte[0]
+        if marker in (0xD9, 0xDA): # EOI / SOS: no metadata past this point
+            return None
+        length_bytes = f.read(2)
+        if len(length_bytes) < 2:
+            return None
+        (segment_length,) = struct.unpack(">H", length_bytes)
+        if segment_length < 2:
+            return None
+        if marker == 0xE1:
+            segment = f.read(segment_length - 2)
+            if segment[:6] == b"Exif\x00\x00":
+                return segment[6:]
+        else:
+            f.seek(segment_length - 2, os.SEEK_CUR)
+    return None
+
+def read_exif_datetime(file_path):
+    """
+    Reads the EXIF DateTimeOriginal of a JPEG or TIFF file.
+    Returns None if unavailable or if the format is not one of EXIF_EXTENSIONS.
+    """
+    if not file_path.lower().endswith(EXIF_EXTENSIONS):
+        return None
+    try:
+        with open(file_path, 'rb', buffering=EXIF_CHUNK_BYTES) as f:
+            if file_path.lower().endswith(('.jpg', '.jpeg')):
+                tiff = _read_jpeg_exif_block(f)
+            else:
+                tiff = f.read(EXIF_MAX_BYTES)
+        return _parse_tiff_datetime(tiff) if tiff else None
+    except OSError:
+        return None
+    except struct.error:
+        logger.debug(f"Malformed EXIF header in '{file_path}', falling back to mtime.")
+    return None
+
+def get_capture_datetime(file_path):
+    """
+    Returns the best known capture time of an image file:
+    EXIF DateTimeOriginal if present, otherwise the file's modification time.
+    """
+    capture_time = read_exif_datetime(file_path)
+    if capture_time:
+        return capture_time
+    try:
+        return datetime.datetime.fromtimestamp(os.path.getmtime(file_path))
+    except (OSError, ValueError, OverflowError):
+        return datetime.datetime.now()
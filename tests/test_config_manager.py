@@ -0,0 +1,32 @@
+# tests/test_config_manager.py
+import json
+from config_manager import ConfigManager, DEFAULT_COPY_OPTIONS, DEFAULT_JOB_QUEUE_SETTINGS, SETTINGS_FILE
+
+def test_profile_round_trip(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    options = {"organize_by_date": True, "max_files_in_memory": 0, "metadata_policy": "times", "ordering": "inode"}
+    saved = ConfigManager()
+    saved.job_queue_settings = {"max_concurrent_jobs": 2, "io_concurrency": 6}
+    saved.save_profile("cards", [str(tmp_path / "card")], str(tmp_path / "photos"), options)
+    assert saved.save_settings([], "")
+
+    loaded = ConfigManager()
+    assert loaded.load_settings()
+    assert loaded.profiles == saved.profiles
+    assert loaded.profiles["cards"]["copy_options"] == options
+    assert loaded.job_queue_settings == {"max_concurrent_jobs": 2, "io_concurrency": 6}
+
+def test_invalid_values_fall_back_to_defaults(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    bad_options = {"organize_by_date": 1, "max_files_in_memory": -5, "metadata_policy": "everything",
+                   "ordering": "size_desc"}
+    with open(SETTINGS_FILE, 'w') as f:
+        json.dump({"copy_options": bad_options,
+                   "job_queue": {"max_concurrent_jobs": 0, "io_concurrency": True},
+                   "profiles": {"old": {"source_folders": [], "destination_folder": "",
+                                        "copy_options": {**bad_options, "max_files_in_memory": 0}}}}, f)
+    manager = ConfigManager()
+    assert manager.load_settings()
+    assert manager.copy_options == DEFAULT_COPY_OPTIONS
+    assert manager.job_queue_settings == DEFAULT_JOB_QUEUE_SETTINGS
+    assert manager.profiles["old"]["copy_options"] == {**DEFAULT_COPY_OPTIONS, "max_files_in_memory": 0}
@@ -0,0 +1,39 @@
+# tests/test_copier_logic.py
+import os
+import shutil
+import stat
+import pytest
+from copier_logic import copy_file
+
+OLD_MTIME_NS = 1_000_000_000 * 10**9 # 2001-09-09
+UNUSUAL_MODE = 0o604
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "source.jpg"
+    path.write_bytes(b"image data")
+    os.chmod(path, UNUSUAL_MODE)
+    os.utime(path, ns=(OLD_MTIME_NS, OLD_MTIME_NS))
+    return path
+
+def test_policy_none_copies_data_only(source, tmp_path):
+    destination = tmp_path / "none.jpg"
+    assert copy_file(str(source), str(destination), 'none') == 0.0
+    assert destination.read_bytes() == b"image data"
+    assert destination.stat().st_mtime_ns != OLD_MTIME_NS
+
+@pytest.mark.skipif(os.name == 'nt', reason="POSIX permission bits")
+def test_policy_times_keeps_times_but_not_mode(source, tmp_path):
+    destination = tmp_path / "times.jpg"
+    copy_file(str(source), str(destination), 'times')
+    assert destination.stat().st_mtime_ns == OLD_MTIME_NS
+    assert stat.S_IMODE(destination.stat().st_mode) != UNUSUAL_MODE
+
+def test_policy_full_matches_copy2(source, tmp_path):
+    destination = tmp_path / "full.jpg"
+    reference = tmp_path / "copy2.jpg"
+    copy_file(str(source), str(destination), 'full')
+    shutil.copy2(source, reference)
+    copied, expected = destination.stat(), reference.stat()
+    assert copied.st_mtime_ns == expected.st_mtime_ns == OLD_MTIME_NS
+    assert copied.st_mode == expected.st_mode
@@ -0,0 +1,92 @@
+# tests/test_copy_plan.py
+import json
+import pytest
+from copy_plan import CopyPlan, PLAN_FORMAT_VERSION
+from file_list import FileList
+
+def write_plan(path, records):
+    header = {"version": PLAN_FORMAT_VERSION, "source_folders": ["src"], "destination_folder": "dst"}
+    with open(path, 'w', encoding='utf-8') as f:
+        for line in [header] + records:
+            f.write(json.dumps(line) + "\n")
+
+def test_save_and_load_round_trip(tmp_path):
+    file_list = FileList(max_in_memory=2)
+    dir_id = file_list.intern_dir("src", device=42)
+    for i in range(5):
+        file_list.append(dir_id, f"img{i}.jpg", i * 10, i)
+    plan = CopyPlan(["src"], "dst", {"ordering": "scan"}, file_list, {"src": {"files": 5, "bytes": 100}})
+    plan.save(tmp_path / "job.plan.jsonl")
+    loaded = CopyPlan.load(tmp_path / "job.plan.jsonl", max_in_memory=2)
+    try:
+        assert list(loaded.file_list.iter_entries()) == list(file_list.iter_entries())
+        assert loaded.file_list.dir_devices() == [42]
+        assert loaded.destination_folder == "dst"
+        assert loaded.options == {"ordering": "scan"}
+    finally:
+        loaded.file_list.close()
+        file_list.close()
+
+@pytest.mark.parametrize("records", [
+    [["f", 0, "a.jpg", 1, 0]],
+    [["d", 0, "src"], ["f", 1, "a.jpg", 1, 0]],
+    [["d", 0, "src"], ["f", -1, "a.jpg", 1, 0]],
+    [["d", 0, "src"], ["f", "0", "a.jpg", 1, 0]],
+    [["d", 1, "src"]],
+])
+def test_load_rejects_undefined_directories(tmp_path, records):
+    write_plan(tmp_path / "bad.plan.jsonl", records)
+    with pytest.raises(ValueError):
+        CopyPlan.load(tmp_path / "bad.plan.jsonl")
+
+@pytest.mark.parametrize("records", [
+    [["d", 0, "src"], ["f", 0, 5, 1, 0]],
+    [["d", 0, "src"], ["f", 0, "a.jpg", -1, 0]],
+    [["d", 0, "src"], ["f", 0, "a.jpg", 1, -7]],
+    [["d", 0, "src"], ["f", 0, "a.jpg", 1.5]],
+    [["d", 0, "src"], ["f", 0, "a.jpg", True]],
+    [["d", 0, "src"], ["f", 0, "a.jpg"]],
+    [["d", 0, "src"], ["f", 0, "a.jpg", 1, 0, 0]],
+    [["d", 0, 7]],
+    [["d", 0, "src", -1]],
+    [["x", 0, "src"]],
+    [{"d": 0}],
+    [[]],
+    [None],
+])
+def test_load_rejects_malformed_records(tmp_path, records):
+    write_plan(tmp_path / "bad.plan.jsonl", records)
+    with pytest.raises(ValueError):
+        CopyPlan.load(tmp_path / "bad.plan.jsonl")
+
+@pytest.mark.parametrize("header", [
+    [1, 2],
+    "plan",
+    {"version": PLAN_FORMAT_VERSION, "source_folders": "src", "destination_folder": "dst"},
+    {"version": PLAN_FORMAT_VERSION, "source_folders": ["src"], "destination_folder": None},
+    {"version": PLAN_FORMAT_VERSION, "source_folders": ["src"], "destination_folder": "dst", "options": []},
+])
+def test_load_rejects_malformed_headers(tmp_path, header):
+    (tmp_path / "bad.plan.jsonl").write_text(json.dumps(header) + "\n", encoding='utf-8')
+    with pytest.raises(ValueError):
+        CopyPlan.load(tmp_path / "bad.plan.jsonl")
+
+def test_copy_worker_reports_unexpected_failures(tmp_path, monkeypatch):
+    import queue
+    import threading
+    import copier_logic
+
+    def broken_order(file_list, ordering):
+        raise RuntimeError("ordering failed")
+        yield
+
+    monkeypatch.setattr(copier_logic, "iter_in_copy_order", broken_order)
+    file_list = FileList(max_in_memory=0)
+    file_list.append(file_list.intern_dir(str(tmp_path)), "a.jpg", 1)
+    plan = CopyPlan([str(tmp_path)], str(tmp_path / "dst"), {}, file_list, {})
+    messages = queue.Queue()
+    copier_logic.copy_worker(plan.source_folders, plan.destination_folder, messages, threading.Event(),
+                             plan=plan, record_history=False)
+    sent = list(messages.queue)
+    assert sent[-1]['type'] == 'finished' and sent[-1]['status'] == 'error'
+    assert [message.get('type') for message in sent].count('finished') == 1
@@ -0,0 +1,57 @@
+# tests/test_copy_stats.py
+import queue
+import time
+from copy_stats import ThroughputMonitor, StatsSampler, RATE_WINDOW
+
+def make_snapshot(files_done, bytes_done, phase='copying', running=True, total_files=100, files_scanned=0):
+    return {'phase': phase, 'running': running, 'files_done': files_done, 'bytes_done': bytes_done,
+            'errors': 0, 'skipped_bytes': 0, 'total_files': total_files, 'total_bytes': total_files * 1000,
+            'metadata_pending': 0, 'files_scanned': files_scanned}
+
+def test_instant_rate_decays_to_zero_when_progress_stops():
+    monitor = ThroughputMonitor()
+    for second in range(5):
+        monitor.update(make_snapshot(second * 10, second * 10_000), now=float(second))
+    assert monitor.summary()['instant_fps'] > 0
+    assert monitor.summary()['eta_seconds'] > 0
+    stalled = make_snapshot(40, 40_000)
+    for second in range(5, 5 + int(RATE_WINDOW) + 2):
+        monitor.update(stalled, now=float(second))
+    summary = monitor.summary()
+    assert summary['instant_fps'] == 0 and summary['instant_mbps'] == 0
+    assert summary['eta_seconds'] is None
+    assert summary['average_fps'] > 0
+
+def test_scanning_workers_have_no_eta():
+    monitor = ThroughputMonitor()
+    monitor.update(make_snapshot(0, 0, phase='scanning', total_files=0, files_scanned=250), now=0.0)
+    monitor.update(make_snapshot(0, 0, phase='scanning', total_files=0, files_scanned=500), now=1.0)
+    summary = monitor.summary()
+    assert summary['eta_seconds'] is None
+    assert summary['scanning_workers'] == 1 and summary['copying_workers'] == 0
+    assert summary['active_workers'] == 1
+    assert summary['files_scanned'] == 500
+
+def test_active_workers_count_busy_threads():
+    monitor = ThroughputMonitor()
+    monitor.update({**make_snapshot(5, 5000), 'metadata_busy': 3}, source=0, now=0.0)
+    monitor.update({**make_snapshot(5, 5000), 'metadata_busy': 1}, source=1, now=0.0)
+    monitor.update({**make_snapshot(9, 9000, running=False), 'metadata_busy': 0}, source=2, now=0.0)
+    summary = monitor.summary()
+    assert summary['copying_workers'] == 2
+    assert summary['metadata_workers'] == 4
+    assert summary['active_workers'] == 6
+
+def test_sampler_sends_on_a_timer_and_one_final_snapshot():
+    messages = queue.Queue()
+    sampler = StatsSampler(lambda: {'files_done': 0}, messages, interval=0.01).start()
+    deadline = time.monotonic() + 5
+    while messages.qsize() < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    sampler.stop()
+    sampler.stop()
+    sent = list(messages.queue)
+    assert len(sent) >= 4
+    assert all(message['type'] == 'stats' for message in sent)
+    assert [message['running'] for message in sent].count(False) == 1
+    assert sent[-1]['running'] is False
@@ -0,0 +1,66 @@
+# tests/test_file_list.py
+import os
+import pytest
+from file_list import FileList
+
+def build_list(max_in_memory, count=23):
+    file_list = FileList(max_in_memory=max_in_memory)
+    dirs = [file_list.intern_dir(os.path.join("root", f"d{i}")) for i in range(3)]
+    entries = []
+    for i in range(count):
+        entry = (dirs[i % 3], f"img_{i:03d}_é.jpg", (i * 7919) % 101, (i * 31) % 17)
+        file_list.append(*entry)
+        entries.append(entry)
+    return file_list, entries
+
+def test_spill_keeps_insertion_order_and_totals():
+    file_list, entries = build_list(max_in_memory=5)
+    try:
+        assert file_list._spill_file is not None
+        assert len(file_list) == len(entries)
+        assert file_list.total_bytes == sum(entry[2] for entry in entries)
+        assert list(file_list.iter_entries()) == entries
+        assert list(file_list) == [(os.path.join("root", f"d{d}", n), s) for d, n, s, _ in entries]
+    finally:
+        file_list.close()
+
+def test_in_memory_list_does_not_spill():
+    file_list, entries = build_list(max_in_memory=0)
+    assert file_list._spill_file is None
+    assert list(file_list.iter_entries()) == entries
+
+def test_sorted_entries_merge_across_spilled_chunks():
+    key = lambda entry: (entry[3], entry[1])
+    for max_in_memory in (0, 1, 4, 7, 100):
+        file_list, entries = build_list(max_in_memory)
+        try:
+            assert list(file_list.sorted_entries(key)) == sorted(entries, key=key)
+            # Sorting leaves the list readable in insertion order
+            assert list(file_list.iter_entries()) == entries
+        finally:
+            file_list.close()
+
+def test_inode_order_groups_by_device():
+    from copier_logic import iter_in_copy_order
+    file_list = FileList(max_in_memory=2)
+    disk_a = file_list.intern_dir("a", device=2)
+    disk_b = file_list.intern_dir("b", device=1)
+    for name, dir_id, inode in (("a1", disk_a, 5), ("b1", disk_b, 9), ("a2", disk_a, 1), ("b2", disk_b, 3)):
+        file_list.append(dir_id, name, 1, inode)
+    try:
+        order = [os.path.basename(path) for path, _ in iter_in_copy_order(file_list, 'inode')]
+        assert order == ["b2", "b1", "a2", "a1"]
+    finally:
+        file_list.close()
+
+def test_closed_list_cannot_be_read():
+    file_list, entries = build_list(max_in_memory=5)
+    file_list.close()
+    assert len(file_list) == len(entries)
+    with pytest.raises(ValueError):
+        list(file_list.iter_entries())
+    with pytest.raises(ValueError):
+        list(file_list.sorted_entries(lambda entry: entry[3]))
+    with pytest.raises(ValueError):
+        file_list.append(0, "late.jpg", 1)
+    file_list.close()
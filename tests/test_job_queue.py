@@ -0,0 +1,65 @@
+# tests/test_job_queue.py
+import queue
+import threading
+import time
+import types
+import pytest
+import copier_logic
+import job_queue
+from job_queue import CopyJob, clamp_io_concurrency, queue_worker, IO_SLOTS_PER_JOB
+
+class CountingSemaphore:
+    """BoundedSemaphore that records the most slots ever held at once."""
+    def __init__(self, value):
+        self._semaphore = threading.BoundedSemaphore(value)
+        self._lock = threading.Lock()
+        self.held = 0
+        self.max_held = 0
+
+    def __enter__(self):
+        self._semaphore.acquire()
+        with self._lock:
+            self.held += 1
+            self.max_held = max(self.max_held, self.held)
+
+    def __exit__(self, *exc_info):
+        with self._lock:
+            self.held -= 1
+        self._semaphore.release()
+
+def test_clamp_io_concurrency():
+    assert clamp_io_concurrency(1, 0) == 1
+    assert clamp_io_concurrency(1, 4) == 4
+    assert clamp_io_concurrency(1, 32) == IO_SLOTS_PER_JOB
+    assert clamp_io_concurrency(3, 32) == 3 * IO_SLOTS_PER_JOB
+
+@pytest.mark.parametrize("io_concurrency", [1, 3])
+def test_concurrent_jobs_stay_within_io_budget(tmp_path, monkeypatch, io_concurrency):
+    monkeypatch.chdir(tmp_path) # The queue records its throughput history in the working directory
+    source = tmp_path / "src"
+    for folder in ("a", "b"):
+        (source / folder).mkdir(parents=True)
+        for i in range(15):
+            (source / folder / f"img{i}.jpg").write_bytes(b"x" * 100)
+
+    semaphores = []
+    def make_semaphore(value):
+        semaphores.append(CountingSemaphore(value))
+        return semaphores[-1]
+    monkeypatch.setattr(job_queue, "threading", types.SimpleNamespace(BoundedSemaphore=make_semaphore))
+
+    real_copy_file = copier_logic.copy_file
+    def slow_copy_file(*args):
+        time.sleep(0.002)
+        return real_copy_file(*args)
+    monkeypatch.setattr(copier_logic, "copy_file", slow_copy_file)
+
+    jobs = [CopyJob(f"job{i}", [str(source)], str(tmp_path / f"dst{i}"), {}) for i in range(3)]
+    messages = queue.Queue()
+    queue_worker(jobs, messages, threading.Event(), max_concurrent_jobs=3, io_concurrency=io_concurrency)
+
+    assert [job.status for job in jobs] == ['completed'] * 3
+    assert all(len(list((tmp_path / f"dst{i}").iterdir())) == 30 for i in range(3))
+    assert len(semaphores) == 1
+    assert 1 <= semaphores[0].max_held <= io_concurrency
+    assert list(messages.queue)[-1]['type'] == 'queue_finished'
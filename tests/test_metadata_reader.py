@@ -0,0 +1,80 @@
+# tests/test_metadata_reader.py
+import datetime
+import io
+import os
+import struct
+import metadata_reader
+from metadata_reader import (
+    _parse_tiff_datetime, _read_jpeg_exif_block, read_exif_datetime, get_capture_datetime
+)
+
+ORIGINAL = b"2021:05:06 07:08:09\x00"
+MODIFIED = b"2022:01:02 03:04:05\x00"
+
+def build_tiff(endian, original=ORIGINAL, modified=None):
+    """Builds a minimal TIFF block: IFD0 (DateTime, Exif pointer) -> Exif IFD (DateTimeOriginal)."""
+    magic = b"II*\x00" if endian == "<" else b"MM\x00*"
+    ifd0_entries = [(0x8769, 4, 1, None)]
+    if modified is not None:
+        ifd0_entries.insert(0, (0x0132, 2, len(modified), None))
+    ifd0_size = 2 + 12 * len(ifd0_entries) + 4
+    exif_offset = 8 + ifd0_size
+    exif_size = 2 + 12 + 4
+    data_offset = exif_offset + exif_size
+    modified_offset = data_offset + len(original)
+
+    ifd0 = struct.pack(endian + "H", len(ifd0_entries))
+    for tag, value_type, count, _ in ifd0_entries:
+        value = exif_offset if tag == 0x8769 else modified_offset
+        ifd0 += struct.pack(endian + "HHII", tag, value_type, count, value)
+    ifd0 += struct.pack(endian + "I", 0)
+    exif = struct.pack(endian + "H", 1) + struct.pack(endian + "HHII", 0x9003, 2, len(original), data_offset)
+    exif += struct.pack(endian + "I", 0)
+    return magic + struct.pack(endian + "I", 8) + ifd0 + exif + original + (modified or b"")
+
+def build_jpeg(tiff, leading_segments=b""):
+    app1 = b"Exif\x00\x00" + tiff
+    return (b"\xFF\xD8" + leading_segments + b"\xFF\xE1" + struct.pack(">H", len(app1) + 2) + app1
+            + b"\xFF\xDA\x00\x02" + b"\x00" * 16 + b"\xFF\xD9")
+
+def test_tiff_datetime_original_little_and_big_endian():
+    expected = datetime.datetime(2021, 5, 6, 7, 8, 9)
+    assert _parse_tiff_datetime(build_tiff("<")) == expected
+    assert _parse_tiff_datetime(build_tiff(">")) == expected
+
+def test_tiff_falls_back_to_datetime_tag():
+    tiff = build_tiff("<", original=b"not a date\x00", modified=MODIFIED)
+    assert _parse_tiff_datetime(tiff) == datetime.datetime(2022, 1, 2, 3, 4, 5)
+
+def test_jpeg_round_trip_skips_leading_segments(tmp_path):
+    app0 = b"\xFF\xE0" + struct.pack(">H", 16) + b"JFIF\x00" + b"\x00" * 9
+    large_app2 = b"\xFF\xE2" + struct.pack(">H", 20000) + b"\x00" * 19998 # Beyond the first read chunk
+    for endian in ("<", ">"):
+        path = tmp_path / f"photo_{endian == '<'}.jpg"
+        path.write_bytes(build_jpeg(build_tiff(endian), app0 + large_app2))
+        assert read_exif_datetime(str(path)) == datetime.datetime(2021, 5, 6, 7, 8, 9)
+
+def test_truncated_and_malformed_headers_return_none(tmp_path):
+    tiff = build_tiff("<")
+    jpeg = build_jpeg(tiff)
+    for cut in (1, 3, 5, 12, 20, len(jpeg) // 2):
+        path = tmp_path / f"cut_{cut}.jpg"
+        path.write_bytes(jpeg[:cut])
+        assert read_exif_datetime(str(path)) is None
+    for cut in range(0, len(tiff) - len(ORIGINAL)):
+        assert _parse_tiff_datetime(tiff[:cut]) is None
+    assert _parse_tiff_datetime(b"XX*\x00" + tiff[4:]) is None
+    corrupt = bytearray(tiff)
+    corrupt[4:8] = struct.pack("<I", 0xFFFFFFF0) # IFD0 offset past the end
+    assert _parse_tiff_datetime(bytes(corrupt)) is None
+    zero_length = b"\xFF\xD8\xFF\xE0\x00\x00"
+    assert _read_jpeg_exif_block(io.BytesIO(zero_length)) is None
+
+def test_unsupported_formats_are_not_opened(tmp_path, monkeypatch):
+    path = tmp_path / "image.png"
+    path.write_bytes(b"\x89PNG")
+    os.utime(path, (0, 1_000_000_000))
+    monkeypatch.setattr(metadata_reader, "open", lambda *a, **k: (_ for _ in ()).throw(AssertionError("opened")),
+                        raising=False)
+    assert read_exif_datetime(str(path)) is None
+    assert get_capture_datetime(str(path)) == datetime.datetime.fromtimestamp(1_000_000_000)